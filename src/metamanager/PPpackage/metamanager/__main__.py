@@ -38,11 +38,17 @@ async def main_command(
     config_path: Annotated[Path, TyperOption("--config")],
     generators_path: Annotated[Optional[Path], TyperOption("--generators")] = None,
     graph_path: Annotated[Optional[Path], TyperOption("--graph")] = None,
+    write_lock_path: Annotated[Optional[Path], TyperOption("--write-lock")] = None,
     just_resolve: bool = False,
 ) -> None:
     try:
         await main(
-            config_path, installation_path, generators_path, graph_path, just_resolve
+            config_path,
+            installation_path,
+            generators_path,
+            graph_path,
+            write_lock_path,
+            just_resolve,
         )
     except:
         print_exc(file=stderr)
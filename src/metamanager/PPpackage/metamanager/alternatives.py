@@ -0,0 +1,33 @@
+from collections.abc import Iterable, Sequence, Set
+from typing import cast as type_cast
+
+from PPpackage.translator.interface.schemes import Literal
+
+from .minimize_model import is_package_variable
+
+
+def get_alternative_assumptions(
+    formula: Iterable[Sequence[int]],
+    mapping_to_string: Sequence[str | None],
+    preferred: Set[int],
+) -> list[Literal]:
+    alternatives = dict[int, None]()
+
+    # the packages that can replace a preferred package in a clause are avoided,
+    # the preferred packages themselves are not forced into the model
+    for clause in formula:
+        packages = [
+            literal
+            for literal in clause
+            if literal > 0 and is_package_variable(mapping_to_string, literal)
+        ]
+
+        if len(packages) > 1 and any(package in preferred for package in packages):
+            for package in packages:
+                if package not in preferred:
+                    alternatives[package] = None
+
+    return [
+        Literal(type_cast(str, mapping_to_string[package - 1]), False)
+        for package in alternatives
+    ]
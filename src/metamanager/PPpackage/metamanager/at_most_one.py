@@ -0,0 +1,36 @@
+from collections.abc import Iterable, Sequence
+
+from PPpackage.translator.interface.schemes import Literal
+
+PAIRWISE_LIMIT = 5
+
+
+def encode_pairwise(symbols: Sequence[str]) -> Iterable[list[Literal]]:
+    for i, first in enumerate(symbols):
+        for second in symbols[i + 1 :]:
+            yield [Literal(first, False), Literal(second, False)]
+
+
+def encode_sequential(
+    symbols: Sequence[str], counter_prefix: str
+) -> Iterable[list[Literal]]:
+    counters = [f"{counter_prefix}-{i}" for i in range(len(symbols) - 1)]
+
+    # counters[i] is true if any of symbols[0..i] is true
+    for i, symbol in enumerate(symbols[:-1]):
+        yield [Literal(symbol, False), Literal(counters[i], True)]
+
+        if i != 0:
+            yield [Literal(counters[i - 1], False), Literal(counters[i], True)]
+            yield [Literal(symbol, False), Literal(counters[i - 1], False)]
+
+    yield [Literal(symbols[-1], False), Literal(counters[-1], False)]
+
+
+def encode_at_most_one(
+    symbols: Sequence[str], counter_prefix: str
+) -> Iterable[list[Literal]]:
+    if len(symbols) <= PAIRWISE_LIMIT:
+        return encode_pairwise(symbols)
+
+    return encode_sequential(symbols, counter_prefix)
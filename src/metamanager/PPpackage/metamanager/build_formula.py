@@ -1,36 +1,34 @@
-from asyncio import as_completed
-from collections.abc import AsyncIterable, Awaitable, Iterable, Mapping
+from collections.abc import AsyncGenerator, AsyncIterable, Iterable, Mapping, Sequence
+from contextlib import aclosing
 from itertools import chain, product
 from typing import Any
 
-from asyncstdlib import chain as async_chain
 from PPpackage.repository_driver.interface.schemes import Requirement
-from PPpackage.utils.async_ import Result
 
 from PPpackage.translator.interface.schemes import Literal
+from PPpackage.utils.async_ import merge_async_iterables
+from PPpackage.utils.json.dump import dump_json
 
+from .at_most_one import encode_at_most_one
 from .repository import Repository
+from .schemes import FormulaConfig
 from .translators import Translator
 
+AUXILIARY_PREFIX = "#auxiliary-"
+FORMULA_QUEUE_SIZE = 1 << 12
 
-async def get_formula(
-    repositories_with_translated_options_tasks: Iterable[
-        Awaitable[tuple[Repository, Any]]
-    ],
-    repositories_to_translated_options_result: Result[Mapping[Repository, Any]],
-) -> AsyncIterable[list[Requirement]]:
-    repositories_to_translated_options = dict[Repository, Any]()
-
-    for translated_options_task in as_completed(
-        repositories_with_translated_options_tasks
-    ):
-        repository, translated_options = await translated_options_task
-        async for requirement in repository.get_formula(translated_options):
-            yield requirement
 
-        repositories_to_translated_options[repository] = translated_options
+async def get_formula(
+    repository_to_translated_options: Mapping[Repository, Any],
+) -> AsyncGenerator[list[Requirement], None]:
+    formulas = [
+        repository.get_formula(translated_options)
+        for repository, translated_options in repository_to_translated_options.items()
+    ]
 
-    repositories_to_translated_options_result.set(repositories_to_translated_options)
+    async with aclosing(merge_async_iterables(formulas, FORMULA_QUEUE_SIZE)) as clauses:
+        async for clause in clauses:
+            yield clause
 
 
 def translate_requirement(
@@ -48,25 +46,106 @@ def translate_requirement(
     return translated_requirement
 
 
-async def translate_requirements(
+def translate_clause_requirements(
+    translators: Mapping[str, Translator], clause: Sequence[Requirement]
+) -> list[Sequence[str]]:
+    translated_clause: list[Sequence[str]] = [[] for _ in clause]
+    translator_to_indices = dict[str, list[int]]()
+
+    for index, requirement in enumerate(clause):
+        if requirement.translator == "noop":
+            translated_clause[index] = [requirement.value]
+        else:
+            translator_to_indices.setdefault(requirement.translator, []).append(index)
+
+    for translator_name, indices in translator_to_indices.items():
+        translated_requirements = translators[translator_name].translate_requirements(
+            clause[index].value for index in indices
+        )
+
+        for index, translated_requirement in zip(indices, translated_requirements):
+            translated_clause[index] = translated_requirement
+
+    return translated_clause
+
+
+class Encoding:
+    def __init__(self, config: FormulaConfig):
+        self.auxiliary_negations = config.negation_encoding == "auxiliary"
+        self.share_disjunctions = config.share_disjunctions
+        self.defined_symbols = set[str]()
+        self.seen_disjunctions = set[str]()
+
+
+def get_auxiliary_symbol(kind: str, requirement: Requirement) -> str:
+    value = requirement.value
+    value_key = value if isinstance(value, str) else dump_json(value)
+
+    return f"{AUXILIARY_PREFIX}{kind}-{requirement.translator}-{value_key}"
+
+
+def encode_disjunction(
+    encoding: Encoding, requirement: Requirement, symbols: Sequence[str]
+) -> tuple[list[Literal], list[Literal] | None]:
+    auxiliary_symbol = get_auxiliary_symbol("disjunction", requirement)
+
+    if auxiliary_symbol in encoding.defined_symbols:
+        return [Literal(auxiliary_symbol, True)], None
+
+    if auxiliary_symbol not in encoding.seen_disjunctions:
+        encoding.seen_disjunctions.add(auxiliary_symbol)
+
+        return [Literal(symbol, True) for symbol in symbols], None
+
+    encoding.defined_symbols.add(auxiliary_symbol)
+
+    definition = list(
+        chain(
+            [Literal(auxiliary_symbol, False)],
+            (Literal(symbol, True) for symbol in symbols),
+        )
+    )
+
+    return [Literal(auxiliary_symbol, True)], definition
+
+
+def translate_clause(
     translators: Mapping[str, Translator],
-    formula: AsyncIterable[list[Requirement]],
-) -> AsyncIterable[list[Literal]]:
-    async for clause in formula:
-        positive_buffer = list[Literal]()
-        negative_buffer = list[list[str]]()
+    clause: Sequence[Requirement],
+    encoding: Encoding | None,
+) -> Iterable[list[Literal]]:
+    positive_buffer = list[Literal]()
+    negative_buffer = list[tuple[Requirement, Sequence[str]]]()
+
+    for literal, translated_requirement in zip(
+        clause, translate_clause_requirements(translators, clause)
+    ):
+        if not literal.polarity:
+            negative_buffer.append((literal, translated_requirement))
+        elif (
+            encoding is not None
+            and encoding.share_disjunctions
+            and len(translated_requirement) > 1
+        ):
+            literals, definition = encode_disjunction(
+                encoding, literal, translated_requirement
+            )
 
-        for literal in clause:
-            translated_requirement = translate_requirement(translators, literal)
+            if definition is not None:
+                yield definition
 
-            if literal.polarity:
-                positive_buffer.extend(
-                    Literal(symbol, True) for symbol in translated_requirement
-                )
-            else:
-                negative_buffer.append(list(translated_requirement))
+            positive_buffer.extend(literals)
+        else:
+            positive_buffer.extend(
+                Literal(symbol, True) for symbol in translated_requirement
+            )
 
-        for combination in product(*negative_buffer):
+    if (
+        encoding is None
+        or not encoding.auxiliary_negations
+        or sum(len(symbols) > 1 for _, symbols in negative_buffer) < 2
+    ):
+        for combination in product(*(symbols for _, symbols in negative_buffer)):
             translated_clause = list(
                 chain(
                     positive_buffer,
@@ -76,24 +155,70 @@ async def translate_requirements(
 
             yield translated_clause
 
+        return
 
-async def build_formula(
-    repository_with_translated_options_tasks: Iterable[
-        Awaitable[tuple[Repository, Any]]
-    ],
-    translators_task: Awaitable[tuple[Mapping[str, Translator], Iterable[Literal]]],
-    requirements: Iterable[Requirement],
-    repository_to_translated_options_result: Result[Mapping[Repository, Any]],
+    negative_literals = list[Literal]()
+
+    for requirement, symbols in negative_buffer:
+        if len(symbols) == 0:
+            return
+        elif len(symbols) == 1:
+            negative_literals.append(Literal(symbols[0], False))
+        else:
+            auxiliary_symbol = get_auxiliary_symbol("negation", requirement)
+
+            if auxiliary_symbol not in encoding.defined_symbols:
+                encoding.defined_symbols.add(auxiliary_symbol)
+
+                for symbol in symbols:
+                    yield [Literal(symbol, False), Literal(auxiliary_symbol, True)]
+
+            negative_literals.append(Literal(auxiliary_symbol, False))
+
+    yield list(chain(positive_buffer, negative_literals))
+
+
+async def translate_requirements(
+    translators: Mapping[str, Translator],
+    formula: AsyncIterable[list[Requirement]],
+    formula_config: FormulaConfig,
 ) -> AsyncIterable[list[Literal]]:
-    formula = get_formula(
-        repository_with_translated_options_tasks,
-        repository_to_translated_options_result,
-    )
+    encoding = Encoding(formula_config)
 
-    translators, _ = await translators_task
+    async for clause in formula:
+        for translated_clause in translate_clause(translators, clause, encoding):
+            yield translated_clause
 
-    async for clause in translate_requirements(
-        translators,
-        async_chain(([requirement] for requirement in requirements), formula),
-    ):
-        yield clause
+
+def build_requirements_formula(
+    translators: Mapping[str, Translator], requirements: Iterable[Requirement]
+) -> Iterable[list[Literal]]:
+    for requirement in requirements:
+        yield from translate_clause(translators, [requirement], None)
+
+
+def build_exclusivity_formula(
+    translators: Mapping[str, Translator],
+) -> Iterable[list[Literal]]:
+    for translator_name, translator in translators.items():
+        for index, group in enumerate(translator.get_exclusive_groups()):
+            yield from encode_at_most_one(
+                list(group),
+                f"{AUXILIARY_PREFIX}at-most-one-{translator_name}-{index}",
+            )
+
+
+async def build_formula(
+    repository_to_translated_options: Mapping[Repository, Any],
+    translators: Mapping[str, Translator],
+    formula_config: FormulaConfig,
+) -> AsyncGenerator[list[Literal], None]:
+    async with aclosing(get_formula(repository_to_translated_options)) as formula:
+        async for clause in translate_requirements(
+            translators, formula, formula_config
+        ):
+            yield clause
+
+    if formula_config.exclusive_versions:
+        for clause in build_exclusivity_formula(translators):
+            yield clause
@@ -0,0 +1,26 @@
+from collections.abc import Iterable
+from pathlib import Path
+
+from sqlitedict import SqliteDict
+
+
+def get_cached_products_index_path(product_cache_path: Path) -> Path:
+    return product_cache_path / "packages.db"
+
+
+def load_cached_products(index_path: Path) -> set[str]:
+    if not index_path.exists():
+        return set()
+
+    with SqliteDict(index_path, flag="r") as index:
+        return set(index.keys())
+
+
+def save_cached_products(index_path: Path, packages: Iterable[str]) -> None:
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with SqliteDict(index_path) as index:
+        for package in packages:
+            index[package] = None
+
+        index.commit()
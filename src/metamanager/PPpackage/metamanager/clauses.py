@@ -0,0 +1,56 @@
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import pairwise
+
+
+class Clauses(Sequence[list[int]]):
+    __slots__ = ("literals", "offsets")
+
+    def __init__(self, clauses: Iterable[Sequence[int]] = ()):
+        # the literals of all clauses are stored in a single flat array
+        self.literals = array("i")
+        self.offsets = array("q", [0])
+
+        self.extend(clauses)
+
+    @staticmethod
+    def from_bytes(literals_bytes: bytes, offsets_bytes: bytes) -> "Clauses":
+        clauses = Clauses()
+
+        clauses.literals.frombytes(literals_bytes)
+
+        clauses.offsets = array("q")
+        clauses.offsets.frombytes(offsets_bytes)
+
+        return clauses
+
+    def to_bytes(self) -> tuple[bytes, bytes]:
+        return self.literals.tobytes(), self.offsets.tobytes()
+
+    def append(self, clause: Iterable[int]) -> None:
+        self.literals.extend(clause)
+        self.offsets.append(len(self.literals))
+
+    def extend(self, clauses: Iterable[Iterable[int]]) -> None:
+        for clause in clauses:
+            self.append(clause)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        return self.literals[self.offsets[index] : self.offsets[index + 1]].tolist()
+
+    def __iter__(self) -> Iterator[list[int]]:
+        literals = self.literals
+
+        return (literals[begin:end].tolist() for begin, end in pairwise(self.offsets))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
@@ -0,0 +1,54 @@
+from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+
+from .clauses import Clauses
+
+
+def find(parents: MutableMapping[int, int], variable: int) -> int:
+    while (parent := parents.setdefault(variable, variable)) != variable:
+        grandparent = parents[parent]
+        parents[variable] = grandparent
+        variable = grandparent
+
+    return variable
+
+
+def union(parents: MutableMapping[int, int], first: int, second: int) -> None:
+    first_root = find(parents, first)
+    second_root = find(parents, second)
+
+    if first_root != second_root:
+        parents[second_root] = first_root
+
+
+def decompose_formula(
+    formula: Sequence[Sequence[int]],
+) -> tuple[list[Clauses], Mapping[int, int]]:
+    parents = dict[int, int]()
+
+    for clause in formula:
+        first_variable = abs(clause[0])
+
+        for literal in clause:
+            union(parents, first_variable, abs(literal))
+
+    root_to_component = dict[int, int]()
+    components = list[Clauses]()
+
+    for clause in formula:
+        root = find(parents, abs(clause[0]))
+        component = root_to_component.setdefault(root, len(components))
+
+        if component == len(components):
+            components.append(Clauses())
+
+        components[component].append(clause)
+
+    variable_to_component = {
+        variable: root_to_component[find(parents, variable)] for variable in parents
+    }
+
+    return components, variable_to_component
+
+
+def is_satisfied_by_false(clauses: Iterable[Sequence[int]]) -> bool:
+    return all(any(literal < 0 for literal in clause) for clause in clauses)
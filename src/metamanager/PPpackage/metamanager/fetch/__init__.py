@@ -20,6 +20,7 @@ from sqlitedict import SqliteDict
 from PPpackage.metamanager.graph import successors as graph_successors
 from PPpackage.metamanager.installer import Installer
 from PPpackage.metamanager.repository import Repository
+from PPpackage.metamanager.resolve import Resolver
 from PPpackage.metamanager.schemes.node import NodeData
 from PPpackage.metamanager.translators import Translator
 from PPpackage.translator.interface.schemes import Literal
@@ -34,6 +35,7 @@ async def process_build_context(
     build_context: BuildContextDetail,
     containerizer: Containerizer,
     containerizer_workdir: Path,
+    resolver: Resolver,
     repositories: Iterable[Repository],
     translators_task: Awaitable[tuple[Mapping[str, Translator], Iterable[Literal]]],
     build_options: Any,
@@ -97,6 +99,7 @@ async def create_dependency_product_infos(
 async def get_build_context(
     containerizer: Containerizer,
     containerizer_workdir: Path,
+    resolver: Resolver,
     repositories: Iterable[Repository],
     translators_task: Awaitable[tuple[Mapping[str, Translator], Iterable[Literal]]],
     package: str,
@@ -116,6 +119,7 @@ async def get_build_context(
         build_context,
         containerizer,
         containerizer_workdir,
+        resolver,
         repositories,
         translators_task,
         build_options,
@@ -218,6 +222,7 @@ def fetch(
     task_group: TaskGroup,
     containerizer: Containerizer,
     containerizer_workdir: Path,
+    resolver: Resolver,
     repositories: Iterable[Repository],
     repository_to_translated_options: Mapping[Repository, Any],
     translators_task: Awaitable[tuple[Mapping[str, Translator], Iterable[Literal]]],
@@ -247,6 +252,7 @@ def fetch(
                 get_build_context(
                     containerizer,
                     containerizer_workdir,
+                    resolver,
                     repositories,
                     translators_task,
                     package,
@@ -15,6 +15,7 @@ from sqlitedict import SqliteDict
 from PPpackage.metamanager.exceptions import SubmanagerCommandFailure
 from PPpackage.metamanager.installer import Installer
 from PPpackage.metamanager.repository import Repository
+from PPpackage.metamanager.resolve import Resolver
 from PPpackage.metamanager.translators import Translator
 from PPpackage.translator.interface.schemes import Literal
 from PPpackage.utils.container import Containerizer
@@ -41,6 +42,7 @@ async def process_build_context_archive(
     build_context: ArchiveBuildContextDetail,
     containerizer: Containerizer,
     containerizer_workdir: Path,
+    resolver: Resolver,
     repositories: Iterable[Repository],
     translators_task: Awaitable[tuple[Mapping[str, Translator], Iterable[Literal]]],
     build_options: Any,
@@ -18,6 +18,7 @@ from sqlitedict import SqliteDict
 from PPpackage.metamanager.graph import successors as graph_successors
 from PPpackage.metamanager.installer import Installer
 from PPpackage.metamanager.repository import Repository
+from PPpackage.metamanager.resolve import Resolver
 from PPpackage.metamanager.translators import Translator
 from PPpackage.translator.interface.schemes import Literal
 from PPpackage.utils.container import Containerizer
@@ -31,6 +32,7 @@ async def process_build_context_meta(
     build_context: MetaBuildContextDetail,
     containerizer: Containerizer,
     containerizer_workdir: Path,
+    resolver: Resolver,
     repositories: Iterable[Repository],
     translators_task: Awaitable[tuple[Mapping[str, Translator], Iterable[Literal]]],
     build_options: Any,
@@ -38,13 +40,12 @@ async def process_build_context_meta(
     package: str,
 ) -> tuple[
     Mapping[Repository, Any],
+    Resolver,
     Iterable[Repository],
     Awaitable[tuple[Mapping[str, Translator], Iterable[Literal]]],
     Any,
     Set[str],
 ]:
-    from PPpackage.metamanager.resolve import resolve
-
     requirements = (
         build_context.requirements
         if not build_context.on_top
@@ -57,9 +58,7 @@ async def process_build_context_meta(
         )
     )
 
-    repository_to_translated_options, model = await resolve(
-        containerizer,
-        containerizer_workdir,
+    repository_to_translated_options, model = await resolver.resolve(
         repositories,
         translators_task,
         build_options,
@@ -68,6 +67,7 @@ async def process_build_context_meta(
 
     return (
         repository_to_translated_options,
+        resolver,
         repositories,
         translators_task,
         build_options,
@@ -80,6 +80,7 @@ async def fetch_package_meta(
     build_context: MetaBuildContextDetail,
     processed_data: tuple[
         Mapping[Repository, Any],
+        Resolver,
         Iterable[Repository],
         Awaitable[tuple[Mapping[str, Translator], Iterable[Literal]]],
         Any,
@@ -99,6 +100,7 @@ async def fetch_package_meta(
 
     (
         repository_to_translated_options,
+        resolver,
         repositories,
         translators_task,
         build_options,
@@ -117,6 +119,7 @@ async def fetch_package_meta(
         await fetch_and_install(
             containerizer,
             containerizer_workdir,
+            resolver,
             repositories,
             repository_to_translated_options,
             translators_task,
@@ -155,8 +158,8 @@ async def fetch_package_meta(
 @get_build_context_info.register
 async def get_build_context_info_meta(
     build_context: MetaBuildContextDetail,
-    processed_data: tuple[Any, Any, Any, Any, Set[str]],
+    processed_data: tuple[Any, Any, Any, Any, Any, Set[str]],
 ) -> BuildContextInfo:
-    _, _, _, _, model = processed_data
+    _, _, _, _, _, model = processed_data
 
     return {"packages": model}
@@ -7,8 +7,10 @@ from httpx import Client as HTTPClient
 from networkx import MultiDiGraph
 from sqlitedict import SqliteDict
 
+from PPpackage.metamanager.cached_products import save_cached_products
 from PPpackage.metamanager.installer import Installer
 from PPpackage.metamanager.repository import Repository
+from PPpackage.metamanager.resolve import Resolver
 from PPpackage.metamanager.translators import Translator
 from PPpackage.translator.interface.schemes import Literal
 from PPpackage.utils.container import Containerizer
@@ -20,6 +22,7 @@ from .install import install
 async def fetch_and_install(
     containerizer: Containerizer,
     containerizer_workdir: Path,
+    resolver: Resolver,
     repositories: Iterable[Repository],
     repository_to_translated_options: Mapping[Repository, Any],
     translators_task: Awaitable[tuple[Mapping[str, Translator], Iterable[Literal]]],
@@ -36,6 +39,7 @@ async def fetch_and_install(
             task_group,
             containerizer,
             containerizer_workdir,
+            resolver,
             repositories,
             repository_to_translated_options,
             translators_task,
@@ -48,3 +52,7 @@ async def fetch_and_install(
         )
 
         await install(installers, graph, installation_path)
+
+    # nested builds record their own graphs
+    if resolver.cached_products_index_path is not None:
+        save_cached_products(resolver.cached_products_index_path, graph.nodes)
@@ -0,0 +1,64 @@
+from collections.abc import Iterable, Mapping, Sequence, Set
+
+from pysat.solvers import Solver as SATSolver
+
+from PPpackage.translator.interface.schemes import Literal
+
+from .minimize_model import is_package_variable
+from .repository import Repository
+from .schemes import Lock
+
+
+def create_lock(repositories: Iterable[Repository], model: Set[str]) -> Lock:
+    return Lock(
+        epochs={repository.name: repository.epoch for repository in repositories},
+        model=frozenset(model),
+    )
+
+
+def are_epochs_current(lock: Lock, repositories: Iterable[Repository]) -> bool:
+    epochs = {repository.name: repository.epoch for repository in repositories}
+
+    return epochs == lock.epochs
+
+
+def is_model_valid(
+    model: Set[str],
+    formula: Iterable[Sequence[int]],
+    mapping_to_int: Mapping[str, int],
+    mapping_to_string: Sequence[str | None],
+    requirements_formula: Iterable[Iterable[Literal]],
+) -> bool:
+    for clause in requirements_formula:
+        if not any((literal.symbol in model) == literal.polarity for literal in clause):
+            return False
+
+    model_variables = {
+        mapping_to_int[symbol] for symbol in model if symbol in mapping_to_int
+    }
+
+    # the model only contains packages, the clauses not satisfied by them must be
+    # satisfiable by the auxiliary variables alone
+    auxiliary_clauses = list[list[int]]()
+
+    for clause in formula:
+        auxiliary_clause = list[int]()
+
+        for literal in clause:
+            variable = abs(literal)
+
+            if not is_package_variable(mapping_to_string, variable):
+                auxiliary_clause.append(literal)
+            elif (variable in model_variables) == (literal > 0):
+                break
+        else:
+            if len(auxiliary_clause) == 0:
+                return False
+
+            auxiliary_clauses.append(auxiliary_clause)
+
+    if len(auxiliary_clauses) == 0:
+        return True
+
+    with SATSolver(bootstrap_with=auxiliary_clauses) as solver:
+        return solver.solve()
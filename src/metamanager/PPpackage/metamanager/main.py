@@ -1,71 +1,128 @@
 from asyncio import TaskGroup
+from dataclasses import replace
 from logging import getLogger
 from pathlib import Path
 from sys import stderr, stdin
 
 from httpx import Client as HTTPClient
 from PPpackage.utils.container import Containerizer
+from PPpackage.utils.json.dump import dump_json
 from PPpackage.utils.json.validate import validate_json_io, validate_json_io_path
 from sqlitedict import SqliteDict
 
+from .cached_products import get_cached_products_index_path
 from .create_graph import create_graph, write_graph_to_file
 from .exceptions import HandledException, handle_exception_group
 from .fetch_and_install import fetch_and_install
 from .generate import generate
 from .installer import Installers
+from .lock import create_lock
 from .repository import Repositories
-from .resolve import resolve
+from .resolve import Resolver
 from .schemes import Config, Input
+from .solver import Solver
 from .translators import Translators
 
 logger = getLogger(__name__)
 
 
+def write_lock(path: Path, input: Input) -> None:
+    with path.open("w") as file:
+        file.write(dump_json(input))
+
+
 async def main(
     config_path: Path,
     installation_path: Path,
     generators_path: Path | None,
     graph_path: Path | None,
+    write_lock_path: Path | None,
     just_resolve: bool,
 ) -> None:
     try:
         config = validate_json_io_path(Config, config_path)
 
-        async with Repositories(
-            config.repository_drivers, config.repositories, config.data_path
-        ) as repositories:
+        containerizer = Containerizer(config.containerizer)
+
+        product_cache_path = (
+            config.product_cache_path
+            if config.product_cache_path is not None
+            else config.data_path / "cache" / "product"
+        )
+
+        translation_cache_path = (
+            config.translation_cache_path
+            if config.translation_cache_path is not None
+            else config.data_path / "cache" / "translation"
+        )
+
+        async with (
+            Repositories(
+                config.repository_drivers, config.repositories, config.data_path
+            ) as repositories,
+            Solver(
+                config.solver, containerizer, config.containerizer_workdir
+            ) as solver,
+        ):
+            resolver = Resolver(
+                solver,
+                config.solver,
+                config.translators,
+                config.formula,
+                translation_cache_path,
+                (
+                    config.mapped_formula_cache_path
+                    if config.mapped_formula_cache_path is not None
+                    else config.data_path / "cache" / "mapped-formula"
+                ),
+                (
+                    (
+                        config.resolved_model_cache_path
+                        if config.resolved_model_cache_path is not None
+                        else config.data_path / "cache" / "resolved-model"
+                    )
+                    if config.cache_resolved_models
+                    else None
+                ),
+                (
+                    config.data_path / "cache" / "previous-model"
+                    if config.sticky_resolution
+                    else None
+                ),
+                (
+                    get_cached_products_index_path(product_cache_path)
+                    if config.prefer_cached_products
+                    else None
+                ),
+            )
+
             async with TaskGroup() as task_group:
                 translators_task = task_group.create_task(
-                    Translators(repositories, config.translators)
-                )
-
-                containerizer = Containerizer(config.containerizer)
-
-                print("Pulling the solver image...", file=stderr)
-                containerizer.pull_if_missing(
-                    "docker.io/fackop/pppackage-solver:latest"
+                    Translators(
+                        repositories, config.translators, translation_cache_path
+                    )
                 )
 
                 input = validate_json_io(Input, stdin.buffer)
 
                 stderr.write("Resolving...\n")
 
-                repository_to_translated_options, model = await resolve(
-                    containerizer,
-                    config.containerizer_workdir,
+                repository_to_translated_options, model = await resolver.resolve(
                     repositories,
                     translators_task,
                     input.options,
                     input.requirements,
+                    input.locks,
                 )
 
-            with HTTPClient() as archive_client:
-                product_cache_path = (
-                    config.product_cache_path
-                    if config.product_cache_path is not None
-                    else config.data_path / "cache" / "product"
+            if write_lock_path is not None:
+                write_lock(
+                    write_lock_path,
+                    replace(input, locks=create_lock(repositories, model)),
                 )
+                stderr.write(f"Lock written to {write_lock_path}.\n")
 
+            with HTTPClient() as archive_client:
                 product_cache_path.mkdir(parents=True, exist_ok=True)
 
                 with SqliteDict(product_cache_path / "mapping.db") as cache_mapping:
@@ -94,6 +151,7 @@ async def main(
                     await fetch_and_install(
                         containerizer,
                         config.containerizer_workdir,
+                        resolver,
                         repositories,
                         repository_to_translated_options,
                         translators_task,
@@ -0,0 +1,73 @@
+from collections.abc import Iterable, Mapping, Sequence
+from hashlib import sha1
+from pathlib import Path
+from typing import Any
+
+from sqlitedict import SqliteDict
+
+from PPpackage.utils.json.dump import dump_json
+
+from .clauses import Clauses
+from .repository import Repository
+from .schemes import FormulaConfig, TranslatorConfig
+from .stale_entries import evict_stale_entries
+
+
+def hash_mapped_formula_key(
+    repository_to_translated_options: Mapping[Repository, Any],
+    translators_config: Mapping[str, TranslatorConfig],
+    formula_config: FormulaConfig,
+) -> str:
+    repositories_key = [
+        [repository.epoch, translated_options]
+        for repository, translated_options in repository_to_translated_options.items()
+    ]
+
+    key_json = dump_json(
+        {
+            "repositories": repositories_key,
+            "translators": translators_config,
+            "normalize": formula_config.normalize,
+            "negation_encoding": formula_config.negation_encoding,
+            "share_disjunctions": formula_config.share_disjunctions,
+            "exclusive_versions": formula_config.exclusive_versions,
+        }
+    )
+
+    hasher = sha1()
+    hasher.update(key_json.encode())
+    return hasher.hexdigest()
+
+
+def load_mapped_formula(
+    cache_path: Path, cache_key: str
+) -> tuple[Clauses, list[str]] | None:
+    if not cache_path.exists():
+        return None
+
+    with SqliteDict(cache_path, flag="r") as cache:
+        try:
+            literals_bytes, offsets_bytes, symbols = cache[cache_key]
+        except KeyError:
+            return None
+
+    return Clauses.from_bytes(literals_bytes, offsets_bytes), symbols
+
+
+def save_mapped_formula(
+    cache_path: Path,
+    cache_key: str,
+    repositories: Iterable[Repository],
+    formula: Clauses,
+    symbols: Sequence[str],
+) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    literals_bytes, offsets_bytes = formula.to_bytes()
+
+    with SqliteDict(cache_path) as cache:
+        cache[cache_key] = literals_bytes, offsets_bytes, list(symbols)
+        cache.commit()
+
+    # formulas of older epochs are never loaded again
+    evict_stale_entries(cache_path, cache_key, repositories)
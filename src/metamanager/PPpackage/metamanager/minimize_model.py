@@ -0,0 +1,68 @@
+from collections.abc import Callable, Iterable, Sequence, Set
+from time import monotonic
+
+from .build_formula import AUXILIARY_PREFIX
+from .exceptions import NoModelException
+from .solver.interface import SolverSessionInterface
+
+
+def is_package_variable(mapping_to_string: Sequence[str | None], variable: int) -> bool:
+    symbol = mapping_to_string[variable - 1]
+
+    return symbol is not None and not symbol.startswith(AUXILIARY_PREFIX)
+
+
+async def minimize_model(
+    solver_session: SolverSessionInterface,
+    create_activation_variable: Callable[[], int],
+    mapping_to_string: Sequence[str | None],
+    variables: Iterable[int],
+    requirements: Sequence[int],
+    model: Set[int],
+    time_budget: float,
+) -> Set[int]:
+    deadline = monotonic() + time_budget
+
+    packages = {
+        variable
+        for variable in model
+        if is_package_variable(mapping_to_string, variable)
+    }
+
+    # the unselected packages stay unselected, they are required per solve so that
+    # the session does not grow with the number of packages
+    unselected_packages = [
+        -variable
+        for variable in variables
+        if variable not in packages and is_package_variable(mapping_to_string, variable)
+    ]
+
+    while len(packages) != 0 and monotonic() < deadline:
+        # at least one of the selected packages must be dropped
+        activation = create_activation_variable()
+        await solver_session.add_clauses(
+            [[*(-package for package in packages), -activation]]
+        )
+
+        try:
+            model = await solver_session.solve(
+                len(mapping_to_string),
+                [activation, *requirements, *unselected_packages],
+                [],
+            )
+        except NoModelException:
+            break
+        finally:
+            await solver_session.add_clauses([[-activation]])
+
+        selected_packages = {
+            variable
+            for variable in model
+            if is_package_variable(mapping_to_string, variable)
+        }
+
+        unselected_packages.extend(-package for package in packages - selected_packages)
+
+        packages = selected_packages
+
+    return model
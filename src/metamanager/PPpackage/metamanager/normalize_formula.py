@@ -0,0 +1,75 @@
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from itertools import chain
+
+from .clauses import Clauses
+
+
+@dataclass(frozen=True)
+class NormalizationStatistics:
+    duplicates: int
+    tautologies: int
+    subsumed: int
+
+
+def normalize_clause(clause: Iterable[int]) -> tuple[int, ...] | None:
+    literals = set(clause)
+
+    if any(-literal in literals for literal in literals):
+        return None
+
+    return tuple(sorted(literals))
+
+
+def normalize_formula(
+    formula: Iterable[Sequence[int]],
+) -> tuple[Clauses, NormalizationStatistics]:
+    unique_clauses = dict[tuple[int, ...], None]()
+    clause_count = 0
+    tautologies = 0
+
+    for clause in formula:
+        clause_count += 1
+
+        normalized_clause = normalize_clause(clause)
+
+        if normalized_clause is None:
+            tautologies += 1
+        else:
+            unique_clauses[normalized_clause] = None
+
+    clauses = list(unique_clauses)
+
+    literal_counts = Counter(chain.from_iterable(clauses))
+
+    # each kept clause is watched by its least frequent literal, a clause can
+    # only subsume another one if the other one contains that literal
+    watches = dict[int, list[tuple[int, ...]]]()
+    is_kept = [False] * len(clauses)
+
+    for index in sorted(range(len(clauses)), key=lambda index: len(clauses[index])):
+        clause = clauses[index]
+        clause_literals = set(clause)
+
+        if any(
+            clause_literals.issuperset(candidate)
+            for literal in clause
+            for candidate in watches.get(literal, [])
+        ):
+            continue
+
+        is_kept[index] = True
+
+        watch = min(clause, key=lambda literal: literal_counts[literal])
+        watches.setdefault(watch, []).append(clause)
+
+    normalized_formula = Clauses(
+        clause for clause, kept in zip(clauses, is_kept) if kept
+    )
+
+    return normalized_formula, NormalizationStatistics(
+        duplicates=clause_count - tautologies - len(clauses),
+        tautologies=tautologies,
+        subsumed=len(clauses) - len(normalized_formula),
+    )
@@ -0,0 +1,141 @@
+from asyncio import Future, get_running_loop
+from collections import deque
+from collections.abc import AsyncIterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import aclosing
+from multiprocessing import get_context
+from typing import Any
+
+from PPpackage.repository_driver.interface.schemes import Requirement
+
+from .build_formula import Encoding, get_formula, translate_clause
+from .repository import Repository
+from .schemes import FormulaConfig, TranslatorConfig
+from .translators import Translator
+
+TRANSLATION_BATCH_SIZE = 1 << 12
+
+# a clause block uses its own symbol table, literals are indices into it
+ClauseBlock = tuple[list[str], list[list[int]]]
+# the translations a worker computed for a batch, by translator
+BatchTranslations = dict[str, dict[str, list[str]]]
+
+worker_translators: Mapping[str, Translator] = {}
+worker_encoding: Encoding | None = None
+
+
+def initialize_worker(
+    translators_config: Mapping[str, TranslatorConfig],
+    translators_data: Mapping[str, Any],
+    translators_translations: Mapping[str, Mapping[str, list[str]]],
+    formula_config: FormulaConfig,
+) -> None:
+    global worker_translators, worker_encoding
+
+    worker_translators = {
+        name: Translator(config, translators_data[name], translators_translations[name])
+        for name, config in translators_config.items()
+    }
+    worker_encoding = Encoding(formula_config)
+
+
+def translate_batch(
+    batch: list[list[Requirement]],
+) -> tuple[ClauseBlock, BatchTranslations]:
+    symbol_to_index = dict[str, int]()
+    symbols = list[str]()
+    clauses = list[list[int]]()
+
+    for clause in batch:
+        for translated_clause in translate_clause(
+            worker_translators, clause, worker_encoding
+        ):
+            mapped_clause = list[int]()
+
+            for literal in translated_clause:
+                index = symbol_to_index.get(literal.symbol)
+
+                if index is None:
+                    symbols.append(literal.symbol)
+                    index = len(symbols)
+                    symbol_to_index[literal.symbol] = index
+
+                mapped_clause.append(index if literal.polarity else -index)
+
+            clauses.append(mapped_clause)
+
+    # sent back so that the main process can persist them
+    translations = {
+        name: translator.pop_new_translations()
+        for name, translator in worker_translators.items()
+    }
+
+    return (symbols, clauses), translations
+
+
+def receive_batch(
+    translators: Mapping[str, Translator],
+    translated_batch: tuple[ClauseBlock, BatchTranslations],
+) -> ClauseBlock:
+    block, translations = translated_batch
+
+    for name, translator_translations in translations.items():
+        translators[name].add_translations(translator_translations)
+
+    return block
+
+
+async def batch_formula(
+    formula: AsyncIterable[list[Requirement]],
+) -> AsyncIterable[list[list[Requirement]]]:
+    batch = list[list[Requirement]]()
+
+    async for clause in formula:
+        batch.append(clause)
+
+        if len(batch) == TRANSLATION_BATCH_SIZE:
+            yield batch
+            batch = []
+
+    if len(batch) != 0:
+        yield batch
+
+
+async def translate_formula_parallel(
+    repository_to_translated_options: Mapping[Repository, Any],
+    translators: Mapping[str, Translator],
+    translators_config: Mapping[str, TranslatorConfig],
+    formula_config: FormulaConfig,
+) -> AsyncIterable[ClauseBlock]:
+    loop = get_running_loop()
+    worker_count = formula_config.translation_workers
+
+    executor = ProcessPoolExecutor(
+        worker_count,
+        # forked workers would inherit the open translator data databases
+        mp_context=get_context("forkserver"),
+        initializer=initialize_worker,
+        initargs=(
+            translators_config,
+            {name: translator.data for name, translator in translators.items()},
+            {name: translator.translations for name, translator in translators.items()},
+            formula_config,
+        ),
+    )
+
+    try:
+        pending = deque[Future[tuple[ClauseBlock, BatchTranslations]]]()
+
+        async with aclosing(get_formula(repository_to_translated_options)) as formula:
+            async for batch in batch_formula(formula):
+                pending.append(loop.run_in_executor(executor, translate_batch, batch))
+
+                # keeps the blocks in order and bounds the number of batches in flight
+                if len(pending) > 2 * worker_count:
+                    yield receive_batch(translators, await pending.popleft())
+
+        while len(pending) != 0:
+            yield receive_batch(translators, await pending.popleft())
+    finally:
+        # waiting for the workers to exit would block the event loop
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,59 @@
+from collections.abc import Iterable, Mapping, Sequence
+
+from .clauses import Clauses
+
+
+def index_formula(
+    formula: Sequence[Sequence[int]],
+) -> tuple[Mapping[int, Sequence[int]], Sequence[int]]:
+    negative_occurrences = dict[int, list[int]]()
+    positive_clauses = list[int]()
+
+    for index, clause in enumerate(formula):
+        is_positive = True
+
+        for literal in clause:
+            if literal < 0:
+                negative_occurrences.setdefault(-literal, []).append(index)
+                is_positive = False
+
+        if is_positive:
+            positive_clauses.append(index)
+
+    return negative_occurrences, positive_clauses
+
+
+def prune_formula(
+    formula: Sequence[Sequence[int]],
+    negative_occurrences: Mapping[int, Sequence[int]],
+    positive_clauses: Sequence[int],
+    roots: Iterable[int],
+) -> Clauses:
+    reachable = set(roots)
+
+    for index in positive_clauses:
+        reachable.update(formula[index])
+
+    stack = list(reachable)
+
+    while len(stack) != 0:
+        variable = stack.pop()
+
+        for index in negative_occurrences.get(variable, []):
+            for literal in formula[index]:
+                if literal > 0 and literal not in reachable:
+                    reachable.add(literal)
+                    stack.append(literal)
+
+    candidate_clauses = set(positive_clauses)
+
+    for variable in reachable:
+        candidate_clauses.update(negative_occurrences.get(variable, []))
+
+    # a clause with a negative literal of an unreachable variable is satisfied
+    # by setting all unreachable variables to false
+    return Clauses(
+        clause
+        for clause in map(formula.__getitem__, sorted(candidate_clauses))
+        if all(-literal in reachable for literal in clause if literal < 0)
+    )
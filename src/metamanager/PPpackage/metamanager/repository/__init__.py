@@ -10,13 +10,19 @@ from PPpackage.repository_driver.interface.schemes import (
     ProductInfo,
     ProductInfos,
     Requirement,
-    TranslatorInfo,
 )
 from PPpackage.utils.async_ import Result
 from sqlitedict import SqliteDict
 
 from PPpackage.metamanager.exceptions import EpochException
 from PPpackage.metamanager.schemes import RepositoryConfig, RepositoryDriverConfig
+from PPpackage.metamanager.translator_data import (
+    CachedTranslatorData,
+    TranslatorData,
+    TranslatorGroup,
+    load_translator_data,
+    save_translator_data,
+)
 from PPpackage.utils.json.dump import dump_json
 
 from .interface import RepositoryInterface
@@ -43,8 +49,10 @@ class Repository:
             else data_path / "cache" / "formula" / config.name
         )
 
+        self.name = config.name
         self.interface = interface
         self.epoch = epoch
+        self.cached_translator_data: CachedTranslatorData | None = None
 
     @staticmethod
     async def create(
@@ -53,31 +61,37 @@ class Repository:
         epoch = await interface.get_epoch()
         return Repository(config, interface, epoch, data_path)
 
-    async def fetch_translator_data(self) -> AsyncIterable[TranslatorInfo]:
-        self.translator_data_cache_path.parent.mkdir(parents=True, exist_ok=True)
+    async def fetch_translator_data(self) -> Mapping[str, TranslatorGroup]:
+        cached_translator_data = load_translator_data(
+            self.translator_data_cache_path, self.epoch
+        )
 
-        with SqliteDict(self.translator_data_cache_path) as translator_data_cache:
-            cache_key = self.epoch
+        if cached_translator_data is not None:
+            self.close()
+            self.cached_translator_data = cached_translator_data
 
-            try:
-                translator_data = translator_data_cache[cache_key]
-            except KeyError:
-                translator_data = []
+            return cached_translator_data
 
-                epoch_result = Result[str]()
+        translator_data = TranslatorData()
 
-                async for info in self.interface.fetch_translator_data(epoch_result):
-                    yield info
-                    translator_data.append(info)
+        epoch_result = Result[str]()
 
-                if epoch_result.get() != self.epoch:
-                    raise EpochException()
+        async for info in self.interface.fetch_translator_data(epoch_result):
+            translator_data.add(info.group, info.symbol)
 
-                translator_data_cache[cache_key] = translator_data
-                translator_data_cache.commit()
-            else:
-                for requirement in translator_data:
-                    yield requirement
+        if epoch_result.get() != self.epoch:
+            raise EpochException()
+
+        save_translator_data(
+            self.translator_data_cache_path, self.epoch, translator_data
+        )
+
+        return translator_data
+
+    def close(self) -> None:
+        if self.cached_translator_data is not None:
+            self.cached_translator_data.close()
+            self.cached_translator_data = None
 
     async def translate_options(self, options: Any) -> Any:
         epoch, translated_options = await self.interface.translate_options(options)
@@ -163,8 +177,10 @@ async def Repositories(
     data_path: Path,
 ) -> AsyncGenerator[Iterable[Repository], None]:
     async with AsyncExitStack() as context_stack:
-        yield [
-            await Repository.create(
+        repositories = list[Repository]()
+
+        for repository_config in repository_configs:
+            repository = await Repository.create(
                 repository_config,
                 await create_repository(
                     context_stack,
@@ -174,5 +190,8 @@ async def Repositories(
                 ),
                 data_path,
             )
-            for repository_config in repository_configs
-        ]
+
+            context_stack.callback(repository.close)
+            repositories.append(repository)
+
+        yield repositories
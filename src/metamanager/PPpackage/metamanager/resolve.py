@@ -1,7 +1,9 @@
-from asyncio import TaskGroup
+from asyncio import Lock, TaskGroup, gather
 from collections.abc import (
+    AsyncGenerator,
     AsyncIterable,
     Awaitable,
+    Callable,
     Iterable,
     Mapping,
     MutableMapping,
@@ -9,26 +11,58 @@ from collections.abc import (
     Sequence,
     Set,
 )
+from contextlib import aclosing
+from itertools import chain
 from pathlib import Path
+from sys import stderr
 from typing import Any
+from typing import cast as type_cast
 
 from PPpackage.repository_driver.interface.schemes import Requirement
-from PPpackage.utils.async_ import Result
 
 from PPpackage.translator.interface.schemes import Literal
-from PPpackage.utils.container import Containerizer
-from PPpackage.utils.file import TemporaryDirectory
-
-from .build_formula import build_formula
+from PPpackage.utils.json.dump import dump_json
+from PPpackage.utils.lock.by_key import lock_by_key
+
+from .alternatives import get_alternative_assumptions
+from .build_formula import (
+    build_exclusivity_formula,
+    build_formula,
+    build_requirements_formula,
+)
+from .cached_products import load_cached_products
+from .clauses import Clauses
+from .decompose_formula import decompose_formula, is_satisfied_by_false
 from .exceptions import NoModelException
+from .lock import are_epochs_current, is_model_valid
+from .mapped_formula import (
+    hash_mapped_formula_key,
+    load_mapped_formula,
+    save_mapped_formula,
+)
+from .minimize_model import is_package_variable, minimize_model
+from .normalize_formula import normalize_formula
+from .parallel_translation import ClauseBlock, translate_formula_parallel
+from .prune_formula import index_formula, prune_formula
 from .repository import Repository
+from .resolved_model import (
+    hash_previous_model_key,
+    hash_resolved_model_key,
+    load_previous_model,
+    load_resolved_model,
+    save_previous_model,
+    save_resolved_model,
+)
+from .schemes import FormulaConfig, SolverConfig, TranslatorConfig
+from .schemes import Lock as ResolutionLock
+from .solver.interface import SolverInterface, SolverSessionInterface
 from .translate_options import translate_options
-from .translators import Translator
+from .translators import Translator, save_translators_translations
 
 
 def get_variable_mapping(
     mapping_to_int: MutableMapping[str, int],
-    mapping_to_string: MutableSequence[str],
+    mapping_to_string: MutableSequence[str | None],
     variable: str,
 ) -> int:
     value = mapping_to_int.get(variable)
@@ -41,137 +75,759 @@ def get_variable_mapping(
     return value
 
 
+def map_clause(
+    mapping_to_int: MutableMapping[str, int],
+    mapping_to_string: MutableSequence[str | None],
+    clause: Iterable[Literal],
+) -> list[int]:
+    mapped_clause = list[int]()
+
+    for literal in clause:
+        symbol_mapped = get_variable_mapping(
+            mapping_to_int, mapping_to_string, literal.symbol
+        )
+        mapped_clause.append(symbol_mapped if literal.polarity else -symbol_mapped)
+
+    if len(mapped_clause) == 0:
+        raise NoModelException
+
+    return mapped_clause
+
+
 async def map_formula(
-    formula: AsyncIterable[list[Literal]],
-) -> tuple[Sequence[list[int]], Mapping[str, int], Sequence[str]]:
-    mapping_to_int = dict[str, int]()
-    mapping_to_string = list[str]()
+    formula: AsyncGenerator[list[Literal], None],
+    mapping_to_int: MutableMapping[str, int],
+    mapping_to_string: MutableSequence[str | None],
+) -> Clauses:
+    mapped_formula = Clauses()
+
+    async with aclosing(formula):
+        async for clause in formula:
+            mapped_formula.append(map_clause(mapping_to_int, mapping_to_string, clause))
+
+    return mapped_formula
 
-    mapped_formula = list[list[int]]()
 
-    async for clause in formula:
-        mapped_clause = list[int]()
+async def map_formula_blocks(
+    blocks: AsyncIterable[ClauseBlock],
+    mapping_to_int: MutableMapping[str, int],
+    mapping_to_string: MutableSequence[str | None],
+) -> Clauses:
+    mapped_formula = Clauses()
+
+    async for symbols, clauses in blocks:
+        block_mapping = [
+            get_variable_mapping(mapping_to_int, mapping_to_string, symbol)
+            for symbol in symbols
+        ]
+
+        for clause in clauses:
+            if len(clause) == 0:
+                raise NoModelException
 
-        for literal in clause:
-            symbol_mapped = get_variable_mapping(
-                mapping_to_int, mapping_to_string, literal.symbol
+            mapped_formula.append(
+                (
+                    block_mapping[literal - 1]
+                    if literal > 0
+                    else -block_mapping[-literal - 1]
+                )
+                for literal in clause
             )
-            mapped_clause.append(symbol_mapped if literal.polarity else -symbol_mapped)
 
-        if len(mapped_clause) == 0:
-            raise NoModelException
+    return mapped_formula
 
-        mapped_formula.append(mapped_clause)
 
-    return mapped_formula, mapping_to_int, mapping_to_string
+def map_assumptions(
+    mapping_to_int: Mapping[str, int], assumptions: Iterable[Literal]
+) -> Sequence[int]:
+    mapped_assumptions = list[int]()
 
+    for assumption in assumptions:
+        assumption_integer = mapping_to_int.get(assumption.symbol)
 
-def write_dimacs(formula: Sequence[list[int]], variable_count: int, path: Path):
-    with path.open("w") as file:
-        file.write(f"p cnf {variable_count} {len(formula)}\n")
+        if assumption_integer is not None:
+            mapped_assumptions.append(
+                assumption_integer if assumption.polarity else -assumption_integer
+            )
 
-        for clause in formula:
-            for literal in clause:
-                file.write(f"{literal} ")
-            file.write("0\n")
+    return mapped_assumptions
 
 
-async def save_dimacs(
-    formula: AsyncIterable[list[Literal]], path: Path
-) -> tuple[Mapping[str, int], Sequence[str]]:
-    mapped_formula, mapping_to_int, mapping_to_string = await map_formula(formula)
+def unmap_model(
+    mapping_to_string: Sequence[str | None], model: Iterable[int]
+) -> Set[str]:
+    return {
+        type_cast(str, mapping_to_string[variable - 1])
+        for variable in model
+        if is_package_variable(mapping_to_string, variable)
+    }
+
+
+def count_packages(mapping_to_string: Sequence[str | None], model: Set[int]) -> int:
+    return sum(is_package_variable(mapping_to_string, variable) for variable in model)
+
+
+async def minimize_session_model(
+    solver_session: SolverSessionInterface,
+    create_activation_variable: Callable[[], int],
+    mapping_to_string: Sequence[str | None],
+    variables: Iterable[int],
+    requirements: Sequence[int],
+    model: Set[int],
+    time_budget: float,
+) -> Set[int]:
+    minimized_model = await minimize_model(
+        solver_session,
+        create_activation_variable,
+        mapping_to_string,
+        variables,
+        requirements,
+        model,
+        time_budget,
+    )
+
+    removed_count = count_packages(mapping_to_string, model) - count_packages(
+        mapping_to_string, minimized_model
+    )
+
+    stderr.write(f"Minimized the model, removed {removed_count} packages.\n")
+
+    return minimized_model
+
+
+async def get_translated_options(
+    repositories: Iterable[Repository], options: Any
+) -> Mapping[Repository, Any]:
+    async with TaskGroup() as task_group:
+        repository_with_translated_options_tasks = list(
+            translate_options(task_group, repositories, options)
+        )
 
-    write_dimacs(mapped_formula, len(mapping_to_string), path)
+        return dict([await task for task in repository_with_translated_options_tasks])
+
+
+class ResolveSession:
+    def __init__(
+        self,
+        mapping_to_int: MutableMapping[str, int],
+        mapping_to_string: MutableSequence[str | None],
+        solver_session: SolverSessionInterface,
+        minimize_time_budget: float | None,
+    ):
+        self.mapping_to_int = mapping_to_int
+        self.mapping_to_string = mapping_to_string
+        self.solver_session = solver_session
+        self.minimize_time_budget = minimize_time_budget
+        self.lock = Lock()
+
+    def create_activation_variable(self) -> int:
+        self.mapping_to_string.append(None)
+
+        return len(self.mapping_to_string)
+
+    async def solve(
+        self,
+        requirements_formula: Iterable[list[Literal]],
+        assumptions: Iterable[Literal],
+    ) -> Set[str]:
+        async with self.lock:
+            clauses = list[list[int]]()
+            activations = list[int]()
+            requirement_literals = list[int]()
+
+            for clause in requirements_formula:
+                mapped_clause = map_clause(
+                    self.mapping_to_int, self.mapping_to_string, clause
+                )
 
-    return mapping_to_int, mapping_to_string
+                # non-unit requirement clauses are guarded so they can be retracted
+                if len(mapped_clause) == 1:
+                    requirement_literals.append(mapped_clause[0])
+                else:
+                    activation = self.create_activation_variable()
+                    clauses.append([*mapped_clause, -activation])
+                    activations.append(activation)
+
+            await self.solver_session.add_clauses(clauses)
+
+            requirements = [*activations, *requirement_literals]
+
+            try:
+                model = await self.solver_session.solve(
+                    len(self.mapping_to_string),
+                    requirements,
+                    map_assumptions(self.mapping_to_int, assumptions),
+                )
 
+                if self.minimize_time_budget is not None:
+                    model = await minimize_session_model(
+                        self.solver_session,
+                        self.create_activation_variable,
+                        self.mapping_to_string,
+                        range(1, len(self.mapping_to_string) + 1),
+                        requirements,
+                        model,
+                        self.minimize_time_budget,
+                    )
+            finally:
+                await self.solver_session.add_clauses(
+                    [[-activation] for activation in activations]
+                )
+
+        return unmap_model(self.mapping_to_string, model)
+
+
+class PrunedResolveSession:
+    def __init__(
+        self,
+        mapping_to_int: MutableMapping[str, int],
+        mapping_to_string: MutableSequence[str | None],
+        formula: Clauses,
+        solver: SolverInterface,
+        minimize_time_budget: float | None,
+        decompose: bool,
+    ):
+        self.mapping_to_int = mapping_to_int
+        self.mapping_to_string = mapping_to_string
+        self.formula = formula
+        self.negative_occurrences, self.positive_clauses = index_formula(formula)
+        self.solver = solver
+        self.minimize_time_budget = minimize_time_budget
+        self.decompose = decompose
+
+    def create_activation_variable(self) -> int:
+        self.mapping_to_string.append(None)
+
+        return len(self.mapping_to_string)
+
+    async def solve(
+        self,
+        requirements_formula: Iterable[list[Literal]],
+        assumptions: Iterable[Literal],
+    ) -> Set[str]:
+        clauses = list[list[int]]()
+        requirement_literals = list[int]()
+
+        for clause in requirements_formula:
+            mapped_clause = map_clause(
+                self.mapping_to_int, self.mapping_to_string, clause
+            )
+
+            if len(mapped_clause) == 1:
+                requirement_literals.append(mapped_clause[0])
+            else:
+                clauses.append(mapped_clause)
+
+        roots = [
+            literal
+            for literal in chain(requirement_literals, chain.from_iterable(clauses))
+            if literal > 0
+        ]
+
+        pruned_formula = prune_formula(
+            self.formula, self.negative_occurrences, self.positive_clauses, roots
+        )
+
+        stderr.write(
+            f"Pruned the formula from {len(self.formula)} "
+            f"to {len(pruned_formula)} clauses.\n"
+        )
+
+        pruned_formula.extend(clauses)
+
+        mapped_assumptions = map_assumptions(self.mapping_to_int, assumptions)
+
+        if not self.decompose:
+            model = await self.solve_component(
+                pruned_formula, requirement_literals, mapped_assumptions
+            )
+        else:
+            model = await self.solve_decomposed(
+                pruned_formula, requirement_literals, mapped_assumptions
+            )
+
+        return unmap_model(self.mapping_to_string, model)
+
+    async def solve_component(
+        self,
+        formula: Sequence[Sequence[int]],
+        requirements: Sequence[int],
+        assumptions: Sequence[int],
+    ) -> Set[int]:
+        solver_session = await self.solver.create_session(formula)
+
+        try:
+            model = await solver_session.solve(
+                len(self.mapping_to_string), requirements, assumptions
+            )
+
+            if self.minimize_time_budget is not None:
+                model = await minimize_session_model(
+                    solver_session,
+                    self.create_activation_variable,
+                    self.mapping_to_string,
+                    {abs(literal) for clause in formula for literal in clause},
+                    requirements,
+                    model,
+                    self.minimize_time_budget,
+                )
+        finally:
+            solver_session.close()
+
+        return model
+
+    async def solve_decomposed(
+        self,
+        formula: Sequence[Sequence[int]],
+        requirements: Sequence[int],
+        assumptions: Sequence[int],
+    ) -> Set[int]:
+        components, variable_to_component = decompose_formula(formula)
+
+        component_requirements = [list[int]() for _ in components]
+        component_assumptions = [list[int]() for _ in components]
+        free_requirements = set[int]()
+
+        for requirement in requirements:
+            component = variable_to_component.get(abs(requirement))
+
+            if component is not None:
+                component_requirements[component].append(requirement)
+            else:
+                free_requirements.add(requirement)
+
+        # the variables of free requirements are in no clause, only the requirements
+        # themselves can conflict
+        if any(-requirement in free_requirements for requirement in free_requirements):
+            raise NoModelException
+
+        model = {requirement for requirement in free_requirements if requirement > 0}
 
-def save_assumptions(
-    mapping_to_int: Mapping[str, int], assumptions: Iterable[Literal], path: Path
-):
-    with path.open("w") as file:
         for assumption in assumptions:
-            assumption_integer = mapping_to_int.get(assumption.symbol)
+            component = variable_to_component.get(abs(assumption))
+
+            if component is not None:
+                component_assumptions[component].append(assumption)
+
+        # the remaining components are satisfied by setting all their variables to false
+        solved_components = [
+            component
+            for component, clauses in enumerate(components)
+            if len(component_requirements[component]) != 0
+            or not is_satisfied_by_false(clauses)
+        ]
+
+        stderr.write(
+            f"Decomposed the formula into {len(components)} components, "
+            f"solving {len(solved_components)} of them.\n"
+        )
 
-            if assumption_integer is not None:
-                file.write(
-                    f"{'' if assumption.polarity else '-'}{assumption_integer}\n"
+        component_models = await gather(
+            *(
+                self.solve_component(
+                    components[component],
+                    component_requirements[component],
+                    component_assumptions[component],
                 )
+                for component in solved_components
+            )
+        )
+
+        for component_model in component_models:
+            model.update(component_model)
+
+        return model
+
+
+class Resolver:
+    def __init__(
+        self,
+        solver: SolverInterface,
+        solver_config: SolverConfig,
+        translators_config: Mapping[str, TranslatorConfig],
+        formula_config: FormulaConfig,
+        translation_cache_path: Path,
+        mapped_formula_cache_path: Path,
+        resolved_model_cache_path: Path | None,
+        previous_model_cache_path: Path | None,
+        cached_products_index_path: Path | None,
+    ):
+        self.solver = solver
+        self.solver_config = solver_config
+        self.translators_config = translators_config
+        self.formula_config = formula_config
+        self.translation_cache_path = translation_cache_path
+        self.mapped_formula_cache_path = mapped_formula_cache_path
+        self.resolved_model_cache_path = resolved_model_cache_path
+        self.previous_model_cache_path = previous_model_cache_path
+        self.cached_products_index_path = cached_products_index_path
+        self.cached_products: Set[str] | None = None
+        self.cached_product_assumptions = dict[str, list[Literal]]()
+        self.mapped_formulas = dict[
+            str, tuple[Clauses, MutableMapping[str, int], list[str | None]]
+        ]()
+        self.mapped_formula_locks = dict[str, Lock]()
+        self.sessions = dict[str, ResolveSession | PrunedResolveSession]()
+        self.session_locks = dict[str, Lock]()
+
+    async def map_formula_cached(
+        self,
+        translators: Mapping[str, Translator],
+        repository_to_translated_options: Mapping[Repository, Any],
+    ) -> tuple[Clauses, MutableMapping[str, int], list[str | None]]:
+        cache_key = hash_mapped_formula_key(
+            repository_to_translated_options,
+            self.translators_config,
+            self.formula_config,
+        )
 
+        cached = load_mapped_formula(self.mapped_formula_cache_path, cache_key)
 
-async def solve(
-    containerizer: Containerizer,
-    containerizer_workdir: Path,
-    translators_task: Awaitable[tuple[Mapping[str, Translator], Iterable[Literal]]],
-    formula: AsyncIterable[list[Literal]],
-) -> Set[str]:
-    containerizer_workdir.mkdir(parents=True, exist_ok=True)
+        if cached is not None:
+            formula, symbols = cached
 
-    with TemporaryDirectory(containerizer_workdir) as mount_dir_path:
-        formula_path = mount_dir_path / "formula"
-        assumptions_path = mount_dir_path / "assumptions"
-        output_path = mount_dir_path / "output"
+            mapping_to_int = {symbol: index + 1 for index, symbol in enumerate(symbols)}
 
-        mapping_to_int, mapping_to_string = await save_dimacs(formula, formula_path)
+            return formula, mapping_to_int, list[str | None](symbols)
 
-        _, assumptions = await translators_task
+        mapping_to_int = dict[str, int]()
+        mapping_to_string = list[str | None]()
 
-        save_assumptions(mapping_to_int, assumptions, assumptions_path)
+        if self.formula_config.translation_workers > 1:
+            formula = await map_formula_blocks(
+                translate_formula_parallel(
+                    repository_to_translated_options,
+                    translators,
+                    self.translators_config,
+                    self.formula_config,
+                ),
+                mapping_to_int,
+                mapping_to_string,
+            )
+
+            if self.formula_config.exclusive_versions:
+                formula.extend(
+                    map_clause(mapping_to_int, mapping_to_string, clause)
+                    for clause in build_exclusivity_formula(translators)
+                )
+        else:
+            formula = await map_formula(
+                build_formula(
+                    repository_to_translated_options, translators, self.formula_config
+                ),
+                mapping_to_int,
+                mapping_to_string,
+            )
 
-        return_code = containerizer.run(
-            [],
-            image="docker.io/fackop/pppackage-solver:latest",
-            mounts=[
+        if self.formula_config.normalize:
+            formula, statistics = normalize_formula(formula)
+
+            stderr.write(
+                f"Normalized the formula, removed {statistics.duplicates} duplicate, "
+                f"{statistics.tautologies} tautological "
+                f"and {statistics.subsumed} subsumed clauses.\n"
+            )
+
+        save_mapped_formula(
+            self.mapped_formula_cache_path,
+            cache_key,
+            repository_to_translated_options.keys(),
+            formula,
+            type_cast(list[str], mapping_to_string),
+        )
+
+        return formula, mapping_to_int, mapping_to_string
+
+    async def get_mapped_formula(
+        self,
+        translators: Mapping[str, Translator],
+        repository_to_translated_options: Mapping[Repository, Any],
+    ) -> tuple[Clauses, MutableMapping[str, int], list[str | None]]:
+        cache_key = dump_json(list(repository_to_translated_options.values()))
+
+        async with lock_by_key(self.mapped_formula_locks, cache_key):
+            mapped_formula = self.mapped_formulas.get(cache_key)
+
+            if mapped_formula is None:
+                mapped_formula = await self.map_formula_cached(
+                    translators, repository_to_translated_options
+                )
+
+                self.mapped_formulas[cache_key] = mapped_formula
+
+        return mapped_formula
+
+    async def get_session(
+        self,
+        translators: Mapping[str, Translator],
+        repository_to_translated_options: Mapping[Repository, Any],
+    ) -> ResolveSession | PrunedResolveSession:
+        cache_key = dump_json(list(repository_to_translated_options.values()))
+
+        async with lock_by_key(self.session_locks, cache_key):
+            session = self.sessions.get(cache_key)
+
+            if session is None:
+                formula, mapping_to_int, mapping_to_string = (
+                    await self.get_mapped_formula(
+                        translators, repository_to_translated_options
+                    )
+                )
+
+                if self.formula_config.prune:
+                    session = PrunedResolveSession(
+                        mapping_to_int,
+                        mapping_to_string,
+                        formula,
+                        self.solver,
+                        self.solver_config.minimize_time_budget,
+                        self.formula_config.decompose,
+                    )
+                else:
+                    solver_session = await self.solver.create_session(formula)
+
+                    session = ResolveSession(
+                        mapping_to_int,
+                        mapping_to_string,
+                        solver_session,
+                        self.solver_config.minimize_time_budget,
+                    )
+
+                self.sessions[cache_key] = session
+
+        return session
+
+    async def get_cached_product_assumptions(
+        self,
+        translators: Mapping[str, Translator],
+        repository_to_translated_options: Mapping[Repository, Any],
+    ) -> Iterable[Literal]:
+        if self.cached_products_index_path is None:
+            return []
+
+        cache_key = dump_json(list(repository_to_translated_options.values()))
+
+        assumptions = self.cached_product_assumptions.get(cache_key)
+
+        if assumptions is None:
+            if self.cached_products is None:
+                self.cached_products = load_cached_products(
+                    self.cached_products_index_path
+                )
+
+            formula, mapping_to_int, mapping_to_string = await self.get_mapped_formula(
+                translators, repository_to_translated_options
+            )
+
+            # only the alternatives of the cached packages are avoided
+            assumptions = get_alternative_assumptions(
+                formula,
+                mapping_to_string,
                 {
-                    "type": "bind",
-                    "source": str(containerizer.translate(mount_dir_path)),
-                    "target": "/mnt/",
-                }
-            ],
+                    mapping_to_int[package]
+                    for package in self.cached_products
+                    if package in mapping_to_int
+                },
+            )
+
+            self.cached_product_assumptions[cache_key] = assumptions
+
+        return assumptions
+
+    async def solve(
+        self,
+        translators: Mapping[str, Translator],
+        repository_to_translated_options: Mapping[Repository, Any],
+        requirements: Sequence[Requirement],
+        assumptions: Iterable[Literal],
+    ) -> Set[str]:
+        session = await self.get_session(translators, repository_to_translated_options)
+
+        try:
+            return await session.solve(
+                build_requirements_formula(translators, requirements), assumptions
+            )
+        except NoModelException:
+            raise NoModelException(requirements)
+
+    async def solve_sticky(
+        self,
+        translators: Mapping[str, Translator],
+        repository_to_translated_options: Mapping[Repository, Any],
+        requirements: Sequence[Requirement],
+        assumptions: Iterable[Literal],
+        previous_model: Set[str] | None,
+    ) -> Set[str]:
+        if previous_model is None:
+            return await self.solve(
+                translators, repository_to_translated_options, requirements, assumptions
+            )
+
+        formula, mapping_to_int, mapping_to_string = await self.get_mapped_formula(
+            translators, repository_to_translated_options
         )
 
-        if return_code != 0:
-            if return_code == 1:
-                raise NoModelException
-            else:
-                raise Exception("Error in solver.")
-
-        with output_path.open("r") as file:
-            return {
-                mapping_to_string[int(variable_int) - 1]
-                for variable_int in file.readlines()
-            }
-
-
-async def resolve(
-    containerizer: Containerizer,
-    containerizer_workdir: Path,
-    repositories: Iterable[Repository],
-    translators_task: Awaitable[tuple[Mapping[str, Translator], Iterable[Literal]]],
-    options: Any,
-    requirements: Iterable[Requirement],
-) -> tuple[Mapping[Repository, Any], Set[str]]:
-    async with TaskGroup() as task_group:
-        repository_with_translated_options_tasks = translate_options(
-            task_group, repositories, options
+        if is_model_valid(
+            previous_model,
+            formula,
+            mapping_to_int,
+            mapping_to_string,
+            build_requirements_formula(translators, requirements),
+        ):
+            stderr.write("The previous model is still valid, reusing it.\n")
+            return previous_model
+
+        # the previous model guides the solver towards a similar solution
+        previous_assumptions = get_alternative_assumptions(
+            formula,
+            mapping_to_string,
+            {
+                mapping_to_int[symbol]
+                for symbol in previous_model
+                if symbol in mapping_to_int
+            },
+        )
+
+        return await self.solve(
+            translators,
+            repository_to_translated_options,
+            requirements,
+            chain(previous_assumptions, assumptions),
+        )
+
+    def save_translations(
+        self, repositories: Iterable[Repository], translators: Mapping[str, Translator]
+    ) -> None:
+        # nested resolves and the translation workers add translations as well
+        save_translators_translations(
+            self.translation_cache_path,
+            repositories,
+            self.translators_config,
+            translators,
+        )
+
+    async def resolve_locked(
+        self,
+        repositories: Iterable[Repository],
+        translators_task: Awaitable[tuple[Mapping[str, Translator], Iterable[Literal]]],
+        options: Any,
+        requirements: Iterable[Requirement],
+        lock: ResolutionLock,
+    ) -> tuple[Mapping[Repository, Any], Set[str]] | None:
+        if not are_epochs_current(lock, repositories):
+            return None
+
+        repository_to_translated_options = await get_translated_options(
+            repositories, options
         )
 
-        repository_to_translated_options_result = Result[Mapping[Repository, Any]]()
+        translators, _ = await translators_task
 
+        try:
+            formula, mapping_to_int, mapping_to_string = await self.get_mapped_formula(
+                translators, repository_to_translated_options
+            )
+
+            if not is_model_valid(
+                lock.model,
+                formula,
+                mapping_to_int,
+                mapping_to_string,
+                build_requirements_formula(translators, requirements),
+            ):
+                return None
+        finally:
+            self.save_translations(repositories, translators)
+
+        return repository_to_translated_options, lock.model
+
+    async def resolve(
+        self,
+        repositories: Iterable[Repository],
+        translators_task: Awaitable[tuple[Mapping[str, Translator], Iterable[Literal]]],
+        options: Any,
+        requirements: Iterable[Requirement],
+        lock: ResolutionLock | None = None,
+    ) -> tuple[Mapping[Repository, Any], Set[str]]:
+        repositories = list(repositories)
         requirements = list(requirements)
 
-        formula = build_formula(
-            repository_with_translated_options_tasks,
-            translators_task,
+        if lock is not None:
+            locked = await self.resolve_locked(
+                repositories, translators_task, options, requirements, lock
+            )
+
+            if locked is not None:
+                return locked
+
+            stderr.write("The lock is out of date, resolving.\n")
+
+        cache_key = hash_resolved_model_key(
+            repositories,
+            self.solver_config,
+            self.translators_config,
+            self.formula_config,
+            options,
             requirements,
-            repository_to_translated_options_result,
         )
 
+        if self.resolved_model_cache_path is not None:
+            cached = load_resolved_model(
+                self.resolved_model_cache_path, cache_key, repositories
+            )
+
+            if cached is not None:
+                return cached
+
+        repository_to_translated_options = await get_translated_options(
+            repositories, options
+        )
+
+        translators, translator_assumptions = await translators_task
+
         try:
-            model = await solve(
-                containerizer, containerizer_workdir, translators_task, formula
+            assumptions = chain(
+                translator_assumptions,
+                await self.get_cached_product_assumptions(
+                    translators, repository_to_translated_options
+                ),
+            )
+
+            if self.previous_model_cache_path is None:
+                model = await self.solve(
+                    translators,
+                    repository_to_translated_options,
+                    requirements,
+                    assumptions,
+                )
+            else:
+                previous_model_key = hash_previous_model_key(
+                    self.translators_config, self.formula_config, options, requirements
+                )
+
+                model = await self.solve_sticky(
+                    translators,
+                    repository_to_translated_options,
+                    requirements,
+                    assumptions,
+                    load_previous_model(
+                        self.previous_model_cache_path, previous_model_key
+                    ),
+                )
+
+                save_previous_model(
+                    self.previous_model_cache_path, previous_model_key, model
+                )
+        finally:
+            self.save_translations(repositories, translators)
+
+        if self.resolved_model_cache_path is not None:
+            save_resolved_model(
+                self.resolved_model_cache_path,
+                cache_key,
+                repositories,
+                repository_to_translated_options,
+                model,
             )
-        except NoModelException:
-            raise NoModelException(requirements)
 
-    return repository_to_translated_options_result.get(), model
+        return repository_to_translated_options, model
@@ -0,0 +1,111 @@
+from collections.abc import Iterable, Mapping, Sequence, Set
+from hashlib import sha1
+from pathlib import Path
+from typing import Any
+
+from PPpackage.repository_driver.interface.schemes import Requirement
+from sqlitedict import SqliteDict
+
+from PPpackage.utils.json.dump import dump_json
+
+from .repository import Repository
+from .schemes import FormulaConfig, SolverConfig, TranslatorConfig
+from .stale_entries import evict_stale_entries
+
+
+def hash_key(key: Any) -> str:
+    hasher = sha1()
+    hasher.update(dump_json(key).encode())
+    return hasher.hexdigest()
+
+
+def hash_resolved_model_key(
+    repositories: Iterable[Repository],
+    solver_config: SolverConfig,
+    translators_config: Mapping[str, TranslatorConfig],
+    formula_config: FormulaConfig,
+    options: Any,
+    requirements: Iterable[Requirement],
+) -> str:
+    return hash_key(
+        {
+            "epochs": [repository.epoch for repository in repositories],
+            "minimize_time_budget": solver_config.minimize_time_budget,
+            "translators": translators_config,
+            "formula": formula_config,
+            "options": options,
+            "requirements": list(requirements),
+        }
+    )
+
+
+def hash_previous_model_key(
+    translators_config: Mapping[str, TranslatorConfig],
+    formula_config: FormulaConfig,
+    options: Any,
+    requirements: Iterable[Requirement],
+) -> str:
+    return hash_key(
+        {
+            "translators": translators_config,
+            "formula": formula_config,
+            "options": options,
+            "requirements": list(requirements),
+        }
+    )
+
+
+def load_resolved_model(
+    cache_path: Path, cache_key: str, repositories: Sequence[Repository]
+) -> tuple[Mapping[Repository, Any], Set[str]] | None:
+    if not cache_path.exists():
+        return None
+
+    with SqliteDict(cache_path, flag="r") as cache:
+        try:
+            translated_options, model = cache[cache_key]
+        except KeyError:
+            return None
+
+    return dict(zip(repositories, translated_options)), frozenset(model)
+
+
+def save_resolved_model(
+    cache_path: Path,
+    cache_key: str,
+    repositories: Sequence[Repository],
+    repository_to_translated_options: Mapping[Repository, Any],
+    model: Set[str],
+) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    translated_options = [
+        repository_to_translated_options[repository] for repository in repositories
+    ]
+
+    with SqliteDict(cache_path) as cache:
+        cache[cache_key] = translated_options, sorted(model)
+        cache.commit()
+
+    evict_stale_entries(cache_path, cache_key, repositories)
+
+
+def load_previous_model(cache_path: Path, cache_key: str) -> Set[str] | None:
+    if not cache_path.exists():
+        return None
+
+    with SqliteDict(cache_path, flag="r") as cache:
+        try:
+            model = cache[cache_key]
+        except KeyError:
+            return None
+
+    return frozenset(model)
+
+
+def save_previous_model(cache_path: Path, cache_key: str, model: Set[str]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with SqliteDict(cache_path) as cache:
+        cache[cache_key] = sorted(model)
+        cache.commit()
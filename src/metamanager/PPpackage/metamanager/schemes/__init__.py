@@ -1,6 +1,7 @@
 from collections.abc import Mapping
 from pathlib import Path
 from typing import Annotated, Any
+from typing import Literal as TypingLiteral
 
 from frozendict import frozendict
 from PPpackage.repository_driver.interface.schemes import (
@@ -8,20 +9,31 @@ from PPpackage.repository_driver.interface.schemes import (
     Parameters,
     Requirement,
 )
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, PlainSerializer, field_validator, model_validator
 from pydantic.dataclasses import dataclass as pydantic_dataclass
 
 from PPpackage.utils.container.schemes import ContainerizerConfig
 from PPpackage.utils.json.validator import WithVariables
 
+# serialized sorted, so that written locks are JSON and stable
+SortedStrings = Annotated[
+    frozenset[str], PlainSerializer(sorted, return_type=list[str])
+]
+
+
+@pydantic_dataclass(frozen=True)
+class Lock:
+    epochs: Mapping[str, str]
+    model: SortedStrings
+
 
 @pydantic_dataclass(frozen=True)
 class Input:
     requirements: list[Requirement]
     options: Any = None
     build_options: Any = None
-    locks: Mapping[str, Mapping[str, str]] = frozendict()
-    generators: frozenset[str] = frozenset()
+    locks: Lock | None = None
+    generators: SortedStrings = frozenset()
 
 
 class RepositoryConfig(BaseModel):
@@ -53,6 +65,37 @@ class GeneratorConfig(BaseModuleConfig):
     pass
 
 
+@pydantic_dataclass(frozen=True)
+class SolverConfig:
+    backend: TypingLiteral["container", "service", "local", "portfolio"] = "container"
+    name: str = "glucose4"
+    portfolio: tuple[str, ...] = ("glucose4", "maplechrono", "minisat22", "mergesat3")
+    parallel: int | None = None
+    timeout: float | None = None
+    minimize_time_budget: float | None = None
+
+
+NegationEncoding = TypingLiteral["product", "auxiliary"]
+
+
+@pydantic_dataclass(frozen=True)
+class FormulaConfig:
+    prune: bool = False
+    normalize: bool = False
+    negation_encoding: NegationEncoding = "product"
+    share_disjunctions: bool = False
+    exclusive_versions: bool = False
+    decompose: bool = False
+    translation_workers: int = 1
+
+    @model_validator(mode="after")
+    def decompose_requires_prune(self) -> "FormulaConfig":
+        if self.decompose and not self.prune:
+            raise ValueError("Formula decomposition requires pruning.")
+
+        return self
+
+
 @pydantic_dataclass(frozen=True)
 class Config:
     translators: Mapping[str, TranslatorConfig]
@@ -62,8 +105,16 @@ class Config:
     containerizer_workdir: Annotated[Path, WithVariables] = Path("/tmp")
     data_path: Annotated[Path, WithVariables] = Path.home() / ".PPpackage/"
     product_cache_path: Annotated[Path, WithVariables] | None = None
+    mapped_formula_cache_path: Annotated[Path, WithVariables] | None = None
+    resolved_model_cache_path: Annotated[Path, WithVariables] | None = None
+    translation_cache_path: Annotated[Path, WithVariables] | None = None
     repository_drivers: Mapping[str, RepositoryDriverConfig] = frozendict()
     generators: Mapping[str, GeneratorConfig] = frozendict()
+    solver: SolverConfig = SolverConfig()
+    formula: FormulaConfig = FormulaConfig()
+    cache_resolved_models: bool = True
+    sticky_resolution: bool = False
+    prefer_cached_products: bool = False
 
     @field_validator("repositories")
     @classmethod
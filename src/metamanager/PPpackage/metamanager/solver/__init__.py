@@ -0,0 +1,87 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from os import cpu_count
+from pathlib import Path
+from sys import stderr
+
+from PPpackage.metamanager.schemes import SolverConfig
+from PPpackage.utils.container import Containerizer
+from PPpackage.utils.file import TemporaryDirectory
+
+from .interface import SolverInterface
+
+
+@asynccontextmanager
+async def Solver(
+    config: SolverConfig,
+    containerizer: Containerizer,
+    containerizer_workdir: Path,
+) -> AsyncGenerator[SolverInterface, None]:
+    match config.backend:
+        case "container":
+            from .container import SOLVER_IMAGE, ContainerSolver
+
+            print("Pulling the solver image...", file=stderr)
+            containerizer.pull_if_missing(SOLVER_IMAGE)
+
+            containerizer_workdir.mkdir(parents=True, exist_ok=True)
+
+            with TemporaryDirectory(containerizer_workdir) as sessions_path:
+                yield ContainerSolver(
+                    containerizer, containerizer_workdir, sessions_path
+                )
+        case "service":
+            from .container import SOLVER_IMAGE
+            from .service import (
+                SOCKET_NAME,
+                ServiceSolver,
+                start_service,
+                wait_for_service,
+            )
+
+            print("Pulling the solver image...", file=stderr)
+            containerizer.pull_if_missing(SOLVER_IMAGE)
+
+            containerizer_workdir.mkdir(parents=True, exist_ok=True)
+
+            with (
+                TemporaryDirectory(containerizer_workdir) as mount_path,
+                TemporaryDirectory(containerizer_workdir) as sessions_path,
+            ):
+                socket_path = mount_path / SOCKET_NAME
+
+                print("Starting the solver service...", file=stderr)
+                container_id = start_service(containerizer, mount_path)
+
+                try:
+                    await wait_for_service(socket_path)
+
+                    yield ServiceSolver(socket_path, sessions_path)
+                finally:
+                    containerizer.stop(container_id)
+        case "portfolio":
+            from .portfolio import PortfolioSolver
+
+            solver = PortfolioSolver(
+                config.portfolio,
+                (
+                    config.parallel
+                    if config.parallel is not None
+                    else min(len(config.portfolio), cpu_count() or 1)
+                ),
+                config.timeout,
+            )
+
+            try:
+                yield solver
+            finally:
+                solver.close()
+        case "local":
+            from .local import LocalSolver
+
+            solver = LocalSolver(config.name)
+
+            try:
+                yield solver
+            finally:
+                solver.close()
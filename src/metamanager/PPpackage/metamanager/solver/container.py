@@ -0,0 +1,99 @@
+from collections.abc import Iterable, Sequence, Set
+from pathlib import Path
+
+from PPpackage.metamanager.exceptions import NoModelException
+from PPpackage.utils.container import Containerizer
+from PPpackage.utils.file import TemporaryDirectory
+
+from .dimacs import ClausesFile
+from .interface import SolverInterface, SolverSessionInterface
+
+SOLVER_IMAGE = "docker.io/fackop/pppackage-solver:latest"
+
+
+def write_assumptions(assumptions: Iterable[int], path: Path) -> None:
+    with path.open("w") as file:
+        for assumption in assumptions:
+            file.write(f"{assumption}\n")
+
+
+class ContainerSolverSession(SolverSessionInterface):
+    def __init__(
+        self,
+        containerizer: Containerizer,
+        containerizer_workdir: Path,
+        clauses_file: ClausesFile,
+    ):
+        self.containerizer = containerizer
+        self.containerizer_workdir = containerizer_workdir
+        self.clauses_file = clauses_file
+
+    async def add_clauses(self, clauses: Sequence[Sequence[int]]) -> None:
+        self.clauses_file.add(clauses)
+
+    async def solve(
+        self,
+        variable_count: int,
+        requirements: Sequence[int],
+        assumptions: Sequence[int],
+    ) -> Set[int]:
+        self.containerizer_workdir.mkdir(parents=True, exist_ok=True)
+
+        with TemporaryDirectory(self.containerizer_workdir) as mount_dir_path:
+            formula_path = mount_dir_path / "formula"
+            assumptions_path = mount_dir_path / "assumptions"
+            output_path = mount_dir_path / "output"
+
+            with formula_path.open("w") as file:
+                self.clauses_file.write_formula(file, variable_count, requirements)
+
+            write_assumptions(assumptions, assumptions_path)
+
+            return_code = self.containerizer.run(
+                [],
+                image=SOLVER_IMAGE,
+                mounts=[
+                    {
+                        "type": "bind",
+                        "source": str(self.containerizer.translate(mount_dir_path)),
+                        "target": "/mnt/",
+                    }
+                ],
+            )
+
+            if return_code != 0:
+                if return_code == 1:
+                    raise NoModelException
+                else:
+                    raise Exception("Error in solver.")
+
+            with output_path.open("r") as file:
+                return {int(variable) for variable in file.readlines()}
+
+    def close(self) -> None:
+        self.clauses_file.remove()
+
+
+class ContainerSolver(SolverInterface):
+    def __init__(
+        self,
+        containerizer: Containerizer,
+        containerizer_workdir: Path,
+        sessions_path: Path,
+    ):
+        self.containerizer = containerizer
+        self.containerizer_workdir = containerizer_workdir
+        self.sessions_path = sessions_path
+        self.session_count = 0
+
+    async def create_session(
+        self, formula: Sequence[Sequence[int]]
+    ) -> SolverSessionInterface:
+        clauses_path = self.sessions_path / str(self.session_count)
+        self.session_count += 1
+
+        return ContainerSolverSession(
+            self.containerizer,
+            self.containerizer_workdir,
+            ClausesFile.create(clauses_path, formula),
+        )
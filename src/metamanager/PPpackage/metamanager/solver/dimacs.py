@@ -0,0 +1,70 @@
+from collections.abc import Iterable, Sequence
+from itertools import batched
+from pathlib import Path
+from shutil import copyfileobj
+from typing import IO
+
+HEADER_WIDTH = 64
+CLAUSE_BATCH_SIZE = 1 << 14
+
+
+def dump_clause(clause: Sequence[int]) -> str:
+    return f"{' '.join(map(str, clause))} 0\n"
+
+
+def write_clauses(file: IO[str], clauses: Iterable[Sequence[int]]) -> int:
+    clause_count = 0
+
+    for batch in batched(clauses, CLAUSE_BATCH_SIZE):
+        file.write("".join(map(dump_clause, batch)))
+        clause_count += len(batch)
+
+    return clause_count
+
+
+def write_header_placeholder(file: IO[str]) -> None:
+    file.write(f"{'':<{HEADER_WIDTH - 1}}\n")
+
+
+def patch_header(file: IO[str], variable_count: int, clause_count: int) -> None:
+    header = f"p cnf {variable_count} {clause_count}"
+
+    if len(header) >= HEADER_WIDTH:
+        raise Exception("DIMACS header does not fit into the placeholder.")
+
+    file.seek(0)
+    file.write(f"{header:<{HEADER_WIDTH - 1}}\n")
+
+
+class ClausesFile:
+    def __init__(self, path: Path, clause_count: int):
+        self.path = path
+        self.clause_count = clause_count
+
+    @staticmethod
+    def create(path: Path, clauses: Iterable[Sequence[int]]) -> "ClausesFile":
+        with path.open("w") as file:
+            clause_count = write_clauses(file, clauses)
+
+        return ClausesFile(path, clause_count)
+
+    def add(self, clauses: Iterable[Sequence[int]]) -> None:
+        with self.path.open("a") as file:
+            self.clause_count += write_clauses(file, clauses)
+
+    def write_formula(
+        self, file: IO[str], variable_count: int, requirements: Iterable[int]
+    ) -> None:
+        write_header_placeholder(file)
+
+        with self.path.open("r") as clauses_file:
+            copyfileobj(clauses_file, file)
+
+        requirement_count = write_clauses(
+            file, ([requirement] for requirement in requirements)
+        )
+
+        patch_header(file, variable_count, self.clause_count + requirement_count)
+
+    def remove(self) -> None:
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,21 @@
+from collections.abc import Sequence, Set
+from typing import Protocol
+
+
+class SolverSessionInterface(Protocol):
+    async def add_clauses(self, clauses: Sequence[Sequence[int]]) -> None: ...
+
+    async def solve(
+        self,
+        variable_count: int,
+        requirements: Sequence[int],
+        assumptions: Sequence[int],
+    ) -> Set[int]: ...
+
+    def close(self) -> None: ...
+
+
+class SolverInterface(Protocol):
+    async def create_session(
+        self, formula: Sequence[Sequence[int]]
+    ) -> SolverSessionInterface: ...
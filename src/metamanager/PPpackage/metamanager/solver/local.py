@@ -0,0 +1,185 @@
+from asyncio import to_thread
+from collections.abc import Iterable, MutableSequence, MutableSet, Sequence, Set
+from itertools import chain
+
+from pysat.solvers import Solver as SATSolver
+
+from PPpackage.metamanager.exceptions import NoModelException
+
+from .interface import SolverInterface, SolverSessionInterface
+
+
+class SolveInterruptedException(Exception):
+    pass
+
+
+class InterruptibleSATSolver(SATSolver):
+    def solve(self, assumptions: Sequence[int] = []) -> bool:
+        satisfiable = self.solve_limited(assumptions=assumptions, expect_interrupt=True)
+
+        if satisfiable is None:
+            raise SolveInterruptedException
+
+        return satisfiable
+
+
+def try_assumption_chunk(
+    solver: SATSolver,
+    assumptions: MutableSequence[int],
+    all_assumptions: Sequence[int],
+    begin: int,
+    end: int,
+) -> bool:
+    assumptions.extend(all_assumptions[begin:end])
+
+    satisfiable = solver.solve(assumptions=assumptions)
+
+    if not satisfiable:
+        del assumptions[len(assumptions) - (end - begin) :]
+
+    return satisfiable
+
+
+def try_assumptions(
+    solver: SATSolver,
+    assumptions: MutableSequence[int],
+    all_assumptions: Sequence[int],
+    begin: int,
+    end: int,
+) -> None:
+    size = end - begin
+
+    if size == 1:
+        try_assumption_chunk(solver, assumptions, all_assumptions, begin, end)
+    else:
+        middle = begin + size // 2
+
+        for half_begin, half_end in [(begin, middle), (middle, end)]:
+            if (
+                not try_assumption_chunk(
+                    solver, assumptions, all_assumptions, half_begin, half_end
+                )
+                and half_end - half_begin > 1
+            ):
+                try_assumptions(
+                    solver, assumptions, all_assumptions, half_begin, half_end
+                )
+
+
+def get_prime_implicant(
+    formula: Iterable[Sequence[int]], model: Sequence[int]
+) -> Set[int]:
+    model_set = set(model)
+
+    true_counts = list[int]()
+    occurrences = dict[int, list[int]]()
+
+    for index, clause in enumerate(formula):
+        true_count = 0
+
+        # a repeated literal must not count as a second true literal
+        for literal in set(clause):
+            if literal in model_set:
+                true_count += 1
+                occurrences.setdefault(literal, []).append(index)
+
+        true_counts.append(true_count)
+
+    implicant = set(model_set)
+
+    # positive literals first so that as few packages as possible stay selected
+    for literal in sorted(model_set, reverse=True):
+        clause_indices = occurrences.get(literal, [])
+
+        if all(true_counts[index] > 1 for index in clause_indices):
+            implicant.remove(literal)
+
+            for index in clause_indices:
+                true_counts[index] -= 1
+
+    return {literal for literal in implicant if literal > 0}
+
+
+def solve_local(
+    solver: SATSolver,
+    formula: Iterable[Sequence[int]],
+    requirements: Sequence[int],
+    assumptions: Sequence[int],
+) -> Set[int]:
+    if not solver.solve(assumptions=requirements):
+        raise NoModelException
+
+    accepted_assumptions = list(requirements)
+
+    if len(assumptions) != 0:
+        try_assumptions(solver, accepted_assumptions, assumptions, 0, len(assumptions))
+
+    solver.solve(assumptions=accepted_assumptions)
+
+    model = solver.get_model()
+
+    return get_prime_implicant(
+        chain(formula, ([requirement] for requirement in requirements)), model
+    )
+
+
+class LocalSolverSession(SolverSessionInterface):
+    def __init__(
+        self,
+        solver: SATSolver,
+        formula: Sequence[Sequence[int]],
+        open_sessions: MutableSet["LocalSolverSession"],
+    ):
+        self.solver = solver
+        # the formula is shared with the caller, only the added clauses are kept here
+        self.formula = formula
+        self.added_clauses = list[Sequence[int]]()
+        self.open_sessions = open_sessions
+
+        open_sessions.add(self)
+
+    def get_clauses(self) -> Iterable[Sequence[int]]:
+        return chain(self.formula, self.added_clauses)
+
+    async def add_clauses(self, clauses: Sequence[Sequence[int]]) -> None:
+        self.solver.append_formula(clauses)
+        self.added_clauses.extend(clauses)
+
+    async def solve(
+        self,
+        variable_count: int,
+        requirements: Sequence[int],
+        assumptions: Sequence[int],
+    ) -> Set[int]:
+        return await to_thread(
+            solve_local, self.solver, self.get_clauses(), requirements, assumptions
+        )
+
+    def close(self) -> None:
+        if self not in self.open_sessions:
+            return
+
+        self.open_sessions.remove(self)
+
+        self.solver.delete()
+        self.added_clauses = []
+
+
+class LocalSolver(SolverInterface):
+    def __init__(self, solver_name: str):
+        self.solver_name = solver_name
+        self.sessions = set[LocalSolverSession]()
+
+    async def create_session(
+        self, formula: Sequence[Sequence[int]]
+    ) -> SolverSessionInterface:
+        solver = await to_thread(
+            SATSolver, name=self.solver_name, bootstrap_with=formula
+        )
+
+        return LocalSolverSession(solver, formula, self.sessions)
+
+    def close(self) -> None:
+        # closing a session removes it from the open sessions
+        for session in list(self.sessions):
+            session.close()
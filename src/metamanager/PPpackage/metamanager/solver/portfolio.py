@@ -0,0 +1,146 @@
+from asyncio import FIRST_COMPLETED, Task, create_task, gather, shield, to_thread
+from asyncio import wait as async_wait
+from asyncio import wait_for
+from collections.abc import Iterable, MutableSet, Sequence, Set
+
+from .interface import SolverInterface, SolverSessionInterface
+from .local import InterruptibleSATSolver, LocalSolverSession, solve_local
+
+
+async def solve_strategy(
+    session: LocalSolverSession,
+    requirements: Sequence[int],
+    assumptions: Sequence[int],
+    timeout: float | None,
+) -> Set[int] | None:
+    future = create_task(
+        to_thread(
+            solve_local,
+            session.solver,
+            session.get_clauses(),
+            requirements,
+            assumptions,
+        )
+    )
+
+    try:
+        return await wait_for(shield(future), timeout)
+    except TimeoutError:
+        return None
+    finally:
+        if not future.done():
+            session.solver.interrupt()
+
+        # the result of an interrupted solve is meaningless
+        await gather(future, return_exceptions=True)
+
+        session.solver.clear_interrupt()
+
+
+class PortfolioSolverSession(SolverSessionInterface):
+    def __init__(
+        self,
+        sessions: Sequence[LocalSolverSession],
+        parallel: int,
+        timeout: float | None,
+        open_sessions: MutableSet["PortfolioSolverSession"],
+    ):
+        self.sessions = sessions
+        self.parallel = parallel
+        self.timeout = timeout
+        self.open_sessions = open_sessions
+
+        open_sessions.add(self)
+
+    async def add_clauses(self, clauses: Sequence[Sequence[int]]) -> None:
+        for session in self.sessions:
+            await session.add_clauses(clauses)
+
+    async def solve(
+        self,
+        variable_count: int,
+        requirements: Sequence[int],
+        assumptions: Sequence[int],
+    ) -> Set[int]:
+        remaining_sessions = iter(self.sessions)
+        pending = set[Task[Set[int] | None]]()
+
+        def start_next_strategy() -> None:
+            session = next(remaining_sessions, None)
+
+            if session is not None:
+                pending.add(
+                    create_task(
+                        solve_strategy(session, requirements, assumptions, self.timeout)
+                    )
+                )
+
+        for _ in range(self.parallel):
+            start_next_strategy()
+
+        try:
+            while len(pending) != 0:
+                done, _ = await async_wait(pending, return_when=FIRST_COMPLETED)
+
+                for task in done:
+                    pending.remove(task)
+
+                    model = task.result()
+
+                    if model is not None:
+                        return model
+
+                    start_next_strategy()
+
+            raise Exception("All solver strategies timed out.")
+        finally:
+            for task in pending:
+                task.cancel()
+
+            await gather(*pending, return_exceptions=True)
+
+    def close(self) -> None:
+        if self not in self.open_sessions:
+            return
+
+        self.open_sessions.remove(self)
+
+        for session in self.sessions:
+            session.close()
+
+
+class PortfolioSolver(SolverInterface):
+    def __init__(
+        self, solver_names: Iterable[str], parallel: int, timeout: float | None
+    ):
+        self.solver_names = list(solver_names)
+        self.parallel = parallel
+        self.timeout = timeout
+        self.sessions = set[PortfolioSolverSession]()
+
+    async def create_session(
+        self, formula: Sequence[Sequence[int]]
+    ) -> SolverSessionInterface:
+        solvers = await gather(
+            *(
+                to_thread(InterruptibleSATSolver, name=name, bootstrap_with=formula)
+                for name in self.solver_names
+            )
+        )
+
+        strategy_sessions = set[LocalSolverSession]()
+
+        return PortfolioSolverSession(
+            [
+                LocalSolverSession(solver, formula, strategy_sessions)
+                for solver in solvers
+            ],
+            self.parallel,
+            self.timeout,
+            self.sessions,
+        )
+
+    def close(self) -> None:
+        # closing a session removes it from the open sessions
+        for session in list(self.sessions):
+            session.close()
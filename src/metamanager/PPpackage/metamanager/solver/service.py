@@ -0,0 +1,119 @@
+from asyncio import open_unix_connection, sleep
+from collections.abc import AsyncIterable, Sequence, Set
+from pathlib import Path
+
+from asyncstdlib import iter as async_iter
+
+from PPpackage.metamanager.exceptions import NoModelException
+from PPpackage.utils.container import Containerizer
+from PPpackage.utils.serialization.asyncio import AsyncioReader, AsyncioWriter
+from PPpackage.utils.serialization.writer import dump_bytes_chunked, dump_many
+
+from .container import SOLVER_IMAGE
+from .dimacs import ClausesFile
+from .interface import SolverInterface, SolverSessionInterface
+
+SOCKET_NAME = "solver.sock"
+CHUNK_SIZE = 1 << 20
+STARTUP_TIMEOUT = 30.0
+STARTUP_POLL_INTERVAL = 0.1
+
+SERVICE_ENTRYPOINT = [
+    "java",
+    "-classpath",
+    "/workdir/sat4j/org.sat4j.core.jar:/workdir",
+    "solver.SolverService",
+    f"/mnt/{SOCKET_NAME}",
+]
+
+
+async def read_chunks(path: Path) -> AsyncIterable[memoryview]:
+    with path.open("rb") as file:
+        while len(chunk := file.read(CHUNK_SIZE)) != 0:
+            yield memoryview(chunk)
+
+
+class ServiceSolverSession(SolverSessionInterface):
+    def __init__(self, socket_path: Path, clauses_file: ClausesFile):
+        self.socket_path = socket_path
+        self.clauses_file = clauses_file
+        self.formula_path = clauses_file.path.with_suffix(".cnf")
+
+    async def add_clauses(self, clauses: Sequence[Sequence[int]]) -> None:
+        self.clauses_file.add(clauses)
+
+    async def solve(
+        self,
+        variable_count: int,
+        requirements: Sequence[int],
+        assumptions: Sequence[int],
+    ) -> Set[int]:
+        with self.formula_path.open("w") as file:
+            self.clauses_file.write_formula(file, variable_count, requirements)
+
+        stream_reader, stream_writer = await open_unix_connection(self.socket_path)
+
+        try:
+            reader = AsyncioReader(stream_reader)
+            writer = AsyncioWriter(stream_writer)
+
+            await writer.write(dump_bytes_chunked(read_chunks(self.formula_path)))
+            await writer.write(dump_many(async_iter(assumptions)))
+
+            satisfiable = await reader.load_one(bool)
+
+            if not satisfiable:
+                raise NoModelException
+
+            return {variable async for variable in reader.load_many(int)}
+        finally:
+            stream_writer.close()
+            await stream_writer.wait_closed()
+
+            self.formula_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        self.clauses_file.remove()
+
+
+class ServiceSolver(SolverInterface):
+    def __init__(self, socket_path: Path, sessions_path: Path):
+        self.socket_path = socket_path
+        self.sessions_path = sessions_path
+        self.session_count = 0
+
+    async def create_session(
+        self, formula: Sequence[Sequence[int]]
+    ) -> SolverSessionInterface:
+        clauses_path = self.sessions_path / str(self.session_count)
+        self.session_count += 1
+
+        return ServiceSolverSession(
+            self.socket_path, ClausesFile.create(clauses_path, formula)
+        )
+
+
+def start_service(containerizer: Containerizer, mount_path: Path) -> str:
+    return containerizer.start(
+        [],
+        image=SOLVER_IMAGE,
+        entrypoint=SERVICE_ENTRYPOINT,
+        mounts=[
+            {
+                "type": "bind",
+                "source": str(containerizer.translate(mount_path)),
+                "target": "/mnt/",
+            }
+        ],
+    )
+
+
+async def wait_for_service(socket_path: Path) -> None:
+    waited = 0.0
+
+    while not socket_path.exists():
+        if waited >= STARTUP_TIMEOUT:
+            raise Exception("The solver service did not start.")
+
+        await sleep(STARTUP_POLL_INTERVAL)
+        waited += STARTUP_POLL_INTERVAL
@@ -0,0 +1,46 @@
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+from sqlitedict import SqliteDict
+
+from .repository import Repository
+
+EPOCHS_TABLE = "epochs"
+
+
+def is_stale(entry_epochs: Mapping[str, str], epochs: Mapping[str, str]) -> bool:
+    return any(
+        name in epochs and epochs[name] != epoch for name, epoch in entry_epochs.items()
+    )
+
+
+def evict_stale_entries(
+    cache_path: Path, cache_key: str, repositories: Iterable[Repository]
+) -> None:
+    epochs = {repository.name: repository.epoch for repository in repositories}
+
+    with SqliteDict(cache_path, tablename=EPOCHS_TABLE) as epochs_cache:
+        epochs_cache[cache_key] = epochs
+        epochs_cache.commit()
+
+        stale_keys = {
+            key
+            for key, entry_epochs in epochs_cache.items()
+            if is_stale(entry_epochs, epochs)
+        }
+
+        # entries are dropped before their epochs, so that none is left untracked
+        with SqliteDict(cache_path) as cache:
+            for key in [
+                key
+                for key in cache.keys()
+                if key in stale_keys or key not in epochs_cache
+            ]:
+                del cache[key]
+
+            cache.commit()
+
+        for key in stale_keys:
+            del epochs_cache[key]
+
+        epochs_cache.commit()
@@ -0,0 +1,130 @@
+from collections.abc import Iterable, Mapping, Set
+from contextlib import closing
+from json import dumps as json_dumps
+from pathlib import Path
+from sqlite3 import connect
+from typing import Any
+
+from sqlitedict import SqliteDict
+
+from PPpackage.translator.interface.schemes import Literal
+from PPpackage.utils.json.dump import dump_json
+
+from .repository import Repository
+from .resolved_model import hash_key
+from .schemes import TranslatorConfig
+
+ASSUMPTIONS_TABLE = "assumptions"
+
+
+def hash_translation_cache_key(
+    config: TranslatorConfig, repositories: Iterable[Repository]
+) -> str:
+    repositories = list(repositories)
+
+    # the setup part identifies the tables of older epochs of the same setup
+    setup_key = hash_key(
+        {
+            "package": config.package,
+            "parameters": config.parameters,
+            "repositories": [repository.name for repository in repositories],
+        }
+    )
+    epochs_key = hash_key([repository.epoch for repository in repositories])
+
+    return f"{setup_key}-{epochs_key}"
+
+
+def get_setup_key(cache_key: str) -> str:
+    return cache_key.partition("-")[0]
+
+
+def is_stale(key: str, cache_keys: Set[str], setup_keys: Set[str]) -> bool:
+    return key not in cache_keys and get_setup_key(key) in setup_keys
+
+
+def get_requirement_key(requirement: Any) -> str:
+    # strings are encoded too, so that no string collides with another requirement
+    try:
+        # plain JSON values are serialized the same way as by dump_json, only faster
+        return json_dumps(requirement, sort_keys=True, separators=(",", ":"))
+    except TypeError:
+        return dump_json(requirement)
+
+
+def load_translations(cache_path: Path, cache_key: str) -> dict[str, list[str]]:
+    if not cache_path.exists() or cache_key not in SqliteDict.get_tablenames(
+        cache_path
+    ):
+        return {}
+
+    with SqliteDict(cache_path, tablename=cache_key, flag="r") as cache:
+        return dict(cache.items())
+
+
+def save_translations(
+    cache_path: Path, cache_key: str, translations: Mapping[str, list[str]]
+) -> None:
+    if len(translations) == 0:
+        return
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with SqliteDict(cache_path, tablename=cache_key) as cache:
+        cache.update(translations)
+        cache.commit()
+
+
+def load_assumptions(cache_path: Path, cache_key: str) -> list[Literal] | None:
+    if not cache_path.exists() or ASSUMPTIONS_TABLE not in SqliteDict.get_tablenames(
+        cache_path
+    ):
+        return None
+
+    with SqliteDict(cache_path, tablename=ASSUMPTIONS_TABLE, flag="r") as cache:
+        return cache.get(cache_key)
+
+
+def save_assumptions(
+    cache_path: Path, cache_key: str, assumptions: Iterable[Literal]
+) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with SqliteDict(cache_path, tablename=ASSUMPTIONS_TABLE) as cache:
+        cache[cache_key] = list(assumptions)
+        cache.commit()
+
+
+def evict_translations(cache_path: Path, cache_keys: Iterable[str]) -> None:
+    if not cache_path.exists():
+        return
+
+    cache_keys = set(cache_keys)
+    setup_keys = {get_setup_key(cache_key) for cache_key in cache_keys}
+    tables = SqliteDict.get_tablenames(cache_path)
+
+    if ASSUMPTIONS_TABLE in tables:
+        with SqliteDict(cache_path, tablename=ASSUMPTIONS_TABLE) as cache:
+            for key in [
+                key for key in cache.keys() if is_stale(key, cache_keys, setup_keys)
+            ]:
+                del cache[key]
+
+            cache.commit()
+
+    # the tables of older epochs are never read again, other setups keep theirs
+    stale_tables = [
+        table
+        for table in tables
+        if table != ASSUMPTIONS_TABLE and is_stale(table, cache_keys, setup_keys)
+    ]
+
+    if len(stale_tables) == 0:
+        return
+
+    with closing(connect(cache_path)) as connection:
+        for table in stale_tables:
+            quoted_table = table.replace('"', '""')
+            connection.execute(f'DROP TABLE "{quoted_table}"')
+
+        connection.commit()
@@ -0,0 +1,292 @@
+from collections.abc import ItemsView, Iterable, Iterator, Mapping, Sequence
+from contextlib import closing
+from itertools import chain
+from pathlib import Path
+from sqlite3 import connect
+from sys import intern
+from typing import Any
+
+from sqlitedict import SqliteDict
+
+
+def _intern_optional(value: str | None) -> str | None:
+    return intern(value) if value is not None else None
+
+
+class SymbolView(Mapping[str, str]):
+    __slots__ = ("group", "index")
+
+    def __init__(self, group: "TranslatorGroup", index: int):
+        self.group = group
+        self.index = index
+
+    def __getitem__(self, key: str) -> str:
+        column = self.group.columns.get(key)
+
+        if column is None or (value := column[self.index]) is None:
+            raise KeyError(key)
+
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (
+            key
+            for key, column in self.group.columns.items()
+            if column[self.index] is not None
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class TranslatorGroup(Sequence[Mapping[str, str]]):
+    __slots__ = ("columns", "length")
+
+    def __init__(self):
+        # missing keys of a symbol are stored as None
+        self.columns = dict[str, list[str | None]]()
+        self.length = 0
+
+    def _add_columns(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            if key not in self.columns:
+                self.columns[intern(key)] = [None] * self.length
+
+    def append(self, symbol: Mapping[str, str]) -> None:
+        self._add_columns(symbol.keys())
+
+        for key, column in self.columns.items():
+            column.append(_intern_optional(symbol.get(key)))
+
+        self.length += 1
+
+    def extend(self, other: "TranslatorGroup") -> None:
+        self._add_columns(other.columns.keys())
+
+        for key, column in self.columns.items():
+            other_column = other.columns.get(key)
+
+            column.extend(
+                other_column if other_column is not None else [None] * other.length
+            )
+
+        self.length += other.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.length))]
+
+        if index < 0:
+            index += self.length
+
+        if not 0 <= index < self.length:
+            raise IndexError(index)
+
+        return SymbolView(self, index)
+
+    def __iter__(self) -> Iterator[Mapping[str, str]]:
+        return (SymbolView(self, index) for index in range(self.length))
+
+    def __len__(self) -> int:
+        return self.length
+
+
+class TranslatorData(Mapping[str, TranslatorGroup]):
+    __slots__ = ("groups", "__weakref__")
+
+    def __init__(self):
+        self.groups = dict[str, TranslatorGroup]()
+
+    def add(self, group: str, symbol: Mapping[str, str]) -> None:
+        symbols = self.groups.get(group)
+
+        if symbols is None:
+            symbols = TranslatorGroup()
+            self.groups[intern(group)] = symbols
+
+        symbols.append(symbol)
+
+    def __getitem__(self, group: str) -> TranslatorGroup:
+        return self.groups[group]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.groups)
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+
+def _get_groups_key(epoch: str) -> str:
+    return f"groups-{epoch}"
+
+
+def _get_groups_table(epoch: str) -> str:
+    return f"translator-data-{epoch}"
+
+
+def _merge_groups(groups: Sequence[TranslatorGroup]) -> TranslatorGroup:
+    if len(groups) == 1:
+        return groups[0]
+
+    merged = TranslatorGroup()
+
+    for symbols in groups:
+        merged.extend(symbols)
+
+    return merged
+
+
+class CachedTranslatorData(Mapping[str, TranslatorGroup]):
+    def __init__(self, cache_path: Path, epoch: str, groups: Iterable[str]):
+        self.cache_path = cache_path
+        self.epoch = epoch
+        self.groups = dict.fromkeys(groups)
+        self.cache: SqliteDict | None = None
+
+    def __getstate__(self) -> Any:
+        return self.cache_path, self.epoch, list(self.groups)
+
+    def __setstate__(self, state: Any) -> None:
+        self.__init__(*state)
+
+    def _get_cache(self) -> SqliteDict:
+        if self.cache is None:
+            self.cache = SqliteDict(
+                self.cache_path, tablename=_get_groups_table(self.epoch), flag="r"
+            )
+
+        return self.cache
+
+    def close(self) -> None:
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    def __getitem__(self, group: str) -> TranslatorGroup:
+        if group not in self.groups:
+            raise KeyError(group)
+
+        return self._get_cache()[group]
+
+    def __contains__(self, group: object) -> bool:
+        return group in self.groups
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.groups)
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def items(self) -> Iterable[tuple[str, TranslatorGroup]]:  # type: ignore
+        # a single scan of the table instead of a query per group
+        return self._get_cache().items()
+
+
+def load_translator_data(cache_path: Path, epoch: str) -> CachedTranslatorData | None:
+    if not cache_path.exists():
+        return None
+
+    with SqliteDict(cache_path, flag="r") as cache:
+        groups = cache.get(_get_groups_key(epoch))
+
+    if groups is None:
+        return None
+
+    return CachedTranslatorData(cache_path, epoch, groups)
+
+
+def _evict_translator_data(cache_path: Path, epoch: str) -> None:
+    groups_key = _get_groups_key(epoch)
+
+    # the markers go first so that no marker refers to a dropped table
+    with SqliteDict(cache_path) as cache:
+        for key in [key for key in cache.keys() if key != groups_key]:
+            del cache[key]
+
+        cache.commit()
+
+    groups_table = _get_groups_table(epoch)
+
+    tables = [
+        table
+        for table in SqliteDict.get_tablenames(cache_path)
+        if table.startswith(_get_groups_table("")) and table != groups_table
+    ]
+
+    with closing(connect(cache_path)) as connection:
+        for table in tables:
+            quoted_table = table.replace('"', '""')
+            connection.execute(f'DROP TABLE "{quoted_table}"')
+
+        connection.commit()
+
+
+def save_translator_data(cache_path: Path, epoch: str, data: TranslatorData) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with SqliteDict(cache_path, tablename=_get_groups_table(epoch)) as cache:
+        for group, symbols in data.items():
+            cache[group] = symbols
+
+        cache.commit()
+
+    # the group names are written last and mark the data as complete
+    with SqliteDict(cache_path) as cache:
+        cache[_get_groups_key(epoch)] = list(data)
+        cache.commit()
+
+    # the cache is per repository, so the data of older epochs is not needed anymore
+    _evict_translator_data(cache_path, epoch)
+
+
+class MergedTranslatorData(Mapping[str, TranslatorGroup]):
+    def __init__(self, sources: Sequence[Mapping[str, TranslatorGroup]]):
+        self.sources = sources
+        self.group_names = dict.fromkeys(chain.from_iterable(sources))
+        self.groups = dict[str, TranslatorGroup]()
+
+    def __getstate__(self) -> Any:
+        return self.sources
+
+    def __setstate__(self, state: Any) -> None:
+        self.__init__(state)
+
+    def _load_all(self) -> None:
+        source_groups = dict[str, list[TranslatorGroup]]()
+
+        for source in self.sources:
+            for group, symbols in source.items():
+                if group not in self.groups:
+                    source_groups.setdefault(group, []).append(symbols)
+
+        for group, symbols_list in source_groups.items():
+            self.groups[group] = _merge_groups(symbols_list)
+
+    def __getitem__(self, group: str) -> TranslatorGroup:
+        symbols = self.groups.get(group)
+
+        if symbols is None:
+            if group not in self.group_names:
+                raise KeyError(group)
+
+            symbols = _merge_groups(
+                [source[group] for source in self.sources if group in source]
+            )
+            self.groups[group] = symbols
+
+        return symbols
+
+    def __contains__(self, group: object) -> bool:
+        return group in self.group_names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.group_names)
+
+    def __len__(self) -> int:
+        return len(self.group_names)
+
+    def items(self) -> ItemsView[str, TranslatorGroup]:
+        if len(self.groups) != len(self.group_names):
+            self._load_all()
+
+        return super().items()
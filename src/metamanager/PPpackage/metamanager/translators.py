@@ -1,44 +1,46 @@
 from asyncio import TaskGroup
-from collections.abc import Iterable, Mapping, MutableMapping, MutableSequence
+from collections.abc import Iterable, Iterator, Mapping
 from itertools import chain
+from pathlib import Path
 from typing import Any
 
 from PPpackage.translator.interface.interface import Interface
-from PPpackage.translator.interface.schemes import Literal
+from PPpackage.translator.interface.schemes import Data, Literal
 from PPpackage.utils.json.validate import validate_python
 from PPpackage.utils.python import load_interface_module
 
 from .repository import Repository
 from .schemes import TranslatorConfig
-
-
-async def repository_fetch_translator_data(
-    repository: Repository,
-    translator_info: MutableMapping[str, MutableSequence[dict[str, str]]],
-):
-    async for info in repository.fetch_translator_data():
-        translator_info.setdefault(info.group, []).append(info.symbol)
+from .translation_cache import (
+    evict_translations,
+    get_requirement_key,
+    hash_translation_cache_key,
+    load_assumptions,
+    load_translations,
+    save_assumptions,
+    save_translations,
+)
+from .translator_data import MergedTranslatorData
 
 
 async def fetch_translator_data(
     repositories: Iterable[Repository],
-) -> Mapping[str, Iterable[dict[str, str]]]:
-    translator_info = dict[str, MutableSequence[dict[str, str]]]()
-
+) -> MergedTranslatorData:
     async with TaskGroup() as group:
-        for repository in repositories:
-            group.create_task(
-                repository_fetch_translator_data(repository, translator_info)
-            )
+        tasks = [
+            group.create_task(repository.fetch_translator_data())
+            for repository in repositories
+        ]
 
-    return translator_info
+    return MergedTranslatorData([task.result() for task in tasks])
 
 
 class Translator:
     def __init__(
         self,
         config: TranslatorConfig,
-        data: Mapping[str, Iterable[dict[str, str]]],
+        data: Data,
+        translations: Mapping[str, list[str]],
     ):
         interface = load_interface_module(Interface, config.package)
         parameters = validate_python(interface.Parameters, config.parameters)
@@ -47,45 +49,142 @@ class Translator:
         self.parameters = parameters
         self.data = data
         self.cache = dict[Any, list[str]]()
+        # keyed on the unvalidated requirement, so repeated values skip validation
+        # and are persisted across runs, see translation_cache
+        self.translations = dict(translations)
+        self.new_translations = dict[str, list[str]]()
+
+    def translate_requirement(self, requirement_unparsed: Any) -> list[str]:
+        # requirements are keyed by their canonical JSON
+        requirement_key = get_requirement_key(requirement_unparsed)
+
+        translated_requirement = self.translations.get(requirement_key)
+
+        if translated_requirement is None:
+            translated_requirement = self.translate_validated(
+                validate_python(self.interface.Requirement, requirement_unparsed)
+            )
+
+            self.translations[requirement_key] = translated_requirement
+            self.new_translations[requirement_key] = translated_requirement
+
+        return translated_requirement
+
+    def add_translations(self, translations: Mapping[str, list[str]]) -> None:
+        self.translations.update(translations)
+        self.new_translations.update(translations)
 
-    def translate_requirement(self, requirement_unparsed: Any) -> Iterable[str]:
-        requirement = validate_python(self.interface.Requirement, requirement_unparsed)
+    def pop_new_translations(self) -> dict[str, list[str]]:
+        new_translations = self.new_translations
+        self.new_translations = {}
 
+        return new_translations
+
+    def translate_validated(self, requirement: Any) -> list[str]:
         translated_requirement = self.cache.get(requirement)
 
         if translated_requirement is None:
-            translated_requirement = self.interface.translate_requirement(
-                self.parameters, self.data, requirement
+            translated_requirement = list(
+                self.interface.translate_requirement(
+                    self.parameters, self.data, requirement
+                )
             )
 
-            translated_requirement_list = list[str]()
+            self.cache[requirement] = translated_requirement
 
-            for symbol in translated_requirement:
-                translated_requirement_list.append(symbol)
-                yield symbol
+        return translated_requirement
 
-            self.cache[requirement] = translated_requirement_list
-        else:
-            yield from translated_requirement
+    def translate_requirements(
+        self, requirements_unparsed: Iterable[Any]
+    ) -> list[list[str]]:
+        return [
+            self.translate_requirement(requirement_unparsed)
+            for requirement_unparsed in requirements_unparsed
+        ]
 
     def get_assumptions(self) -> Iterable[Literal]:
         return self.interface.get_assumptions(self.parameters, self.data)
 
+    def get_exclusive_groups(self) -> Iterable[Iterable[str]]:
+        return self.interface.get_exclusive_groups(self.parameters, self.data)
+
+
+class Assumptions(Iterable[Literal]):
+    def __init__(
+        self,
+        translators: Iterable[Translator],
+        translation_cache_path: Path,
+        cache_keys: Iterable[str],
+    ):
+        self.translators = translators
+        self.translation_cache_path = translation_cache_path
+        self.cache_keys = cache_keys
+        self.assumptions: set[Literal] | None = None
+
+    def get_translator_assumptions(
+        self, translator: Translator, cache_key: str
+    ) -> Iterable[Literal]:
+        # computing the assumptions reads all groups of the translator data
+        assumptions = load_assumptions(self.translation_cache_path, cache_key)
+
+        if assumptions is None:
+            assumptions = list(translator.get_assumptions())
+            save_assumptions(self.translation_cache_path, cache_key, assumptions)
+
+        return assumptions
+
+    def __iter__(self) -> Iterator[Literal]:
+        # computed on first use, the translator data is loaded lazily
+        if self.assumptions is None:
+            self.assumptions = set(
+                chain.from_iterable(
+                    self.get_translator_assumptions(translator, cache_key)
+                    for translator, cache_key in zip(self.translators, self.cache_keys)
+                )
+            )
+
+        return iter(self.assumptions)
+
 
 async def Translators(
     repositories: Iterable[Repository],
     translators_config: Mapping[str, TranslatorConfig],
+    translation_cache_path: Path,
 ) -> tuple[Mapping[str, Translator], Iterable[Literal]]:
+    repositories = list(repositories)
+
     data = await fetch_translator_data(repositories)
 
-    translators = {
-        name: Translator(config, data) for name, config in translators_config.items()
+    cache_keys = {
+        name: hash_translation_cache_key(config, repositories)
+        for name, config in translators_config.items()
     }
 
-    assumptions = set(
-        chain.from_iterable(
-            translator.get_assumptions() for translator in translators.values()
+    evict_translations(translation_cache_path, cache_keys.values())
+
+    translators = {
+        name: Translator(
+            config, data, load_translations(translation_cache_path, cache_keys[name])
         )
+        for name, config in translators_config.items()
+    }
+
+    return translators, Assumptions(
+        translators.values(), translation_cache_path, cache_keys.values()
     )
 
-    return translators, assumptions
+
+def save_translators_translations(
+    translation_cache_path: Path,
+    repositories: Iterable[Repository],
+    translators_config: Mapping[str, TranslatorConfig],
+    translators: Mapping[str, Translator],
+) -> None:
+    repositories = list(repositories)
+
+    for name, translator in translators.items():
+        save_translations(
+            translation_cache_path,
+            hash_translation_cache_key(translators_config[name], repositories),
+            translator.pop_new_translations(),
+        )
@@ -7,6 +7,7 @@ setup(
         "PPpackage.metamanager.fetch",
         "PPpackage.metamanager.schemes",
         "PPpackage.metamanager.repository",
+        "PPpackage.metamanager.solver",
     ],
     version="0.1.0",
     install_requires=[
@@ -32,5 +33,6 @@ setup(
         "sqlitedict",
         "hishel[sqlite]",
         "aiohttp",
+        "python-sat",
     ],
 )
@@ -0,0 +1,45 @@
+from itertools import product
+
+
+def is_satisfied(formula, positives):
+    return all(
+        any((literal > 0) == (abs(literal) in positives) for literal in clause)
+        for clause in formula
+    )
+
+
+def enumerate_positives(variable_count):
+    for values in product([False, True], repeat=variable_count):
+        yield {variable for variable, value in enumerate(values, 1) if value}
+
+
+def random_formula(
+    random, variable_count, max_clause_count, max_clause_size=3, min_clause_count=1
+):
+    return [
+        [
+            random.choice([-1, 1]) * random.randint(1, variable_count)
+            for _ in range(random.randint(1, max_clause_size))
+        ]
+        for _ in range(random.randint(min_clause_count, max_clause_count))
+    ]
+
+
+def is_symbolic_satisfied(formula, assignment):
+    return all(
+        any(assignment[literal.symbol] == literal.polarity for literal in clause)
+        for clause in formula
+    )
+
+
+def is_symbolic_satisfiable(formula, assignment):
+    auxiliary_symbols = sorted(
+        {literal.symbol for clause in formula for literal in clause} - assignment.keys()
+    )
+
+    return any(
+        is_symbolic_satisfied(
+            formula, assignment | dict(zip(auxiliary_symbols, values))
+        )
+        for values in product([False, True], repeat=len(auxiliary_symbols))
+    )
@@ -0,0 +1,22 @@
+from PPpackage.metamanager.alternatives import get_alternative_assumptions
+from PPpackage.metamanager.build_formula import AUXILIARY_PREFIX
+
+
+def test_alternatives():
+    mapping_to_string = ["x", "d", "app", "lib", "lib-old", f"{AUXILIARY_PREFIX}0"]
+
+    formula = [[-1, 2], [-3, 4, 5, 6], [-3, 4]]
+
+    assumptions = get_alternative_assumptions(formula, mapping_to_string, {1, 4})
+
+    assert [(literal.symbol, literal.polarity) for literal in assumptions] == [
+        ("lib-old", False)
+    ]
+
+
+def test_unrelated_preferred():
+    mapping_to_string = ["x", "d", "app", "lib"]
+
+    formula = [[-1, 2], [-3, 4]]
+
+    assert get_alternative_assumptions(formula, mapping_to_string, {1, 2}) == []
@@ -0,0 +1,26 @@
+from itertools import product
+
+from formulas import is_symbolic_satisfiable
+
+from PPpackage.metamanager.at_most_one import encode_at_most_one, encode_sequential
+
+
+def check_encoding(formula, symbols):
+    for values in product([False, True], repeat=len(symbols)):
+        assert is_symbolic_satisfiable(formula, dict(zip(symbols, values))) == (
+            sum(values) <= 1
+        )
+
+
+def test_at_most_one():
+    for count in range(1, 8):
+        symbols = [f"symbol-{i}" for i in range(count)]
+
+        check_encoding(list(encode_at_most_one(symbols, "counter")), symbols)
+
+
+def test_sequential():
+    for count in range(2, 8):
+        symbols = [f"symbol-{i}" for i in range(count)]
+
+        check_encoding(list(encode_sequential(symbols, "counter")), symbols)
@@ -0,0 +1,89 @@
+from random import Random
+
+from formulas import is_symbolic_satisfiable, is_symbolic_satisfied
+from PPpackage.repository_driver.interface.schemes import Requirement
+
+from PPpackage.metamanager.build_formula import Encoding, translate_clause
+from PPpackage.metamanager.schemes import FormulaConfig
+
+
+class Translator:
+    def __init__(self, translations):
+        self.translations = translations
+
+    def translate_requirements(self, requirements):
+        return [self.translations[requirement] for requirement in requirements]
+
+
+def random_translators(random, packages, requirement_count):
+    return {
+        "test": Translator(
+            [
+                random.sample(packages, random.randint(0, 3))
+                for _ in range(requirement_count)
+            ]
+        )
+    }
+
+
+def random_requirements_formula(random, requirement_count):
+    return [
+        [
+            Requirement(
+                "test",
+                random.randrange(requirement_count),
+                random.choice([False, True]),
+            )
+            for _ in range(random.randint(1, 3))
+        ]
+        for _ in range(random.randint(1, 4))
+    ]
+
+
+def check_encoding(formula_config, seed):
+    random = Random(seed)
+
+    packages = [f"package-{i}" for i in range(4)]
+    requirement_count = 4
+
+    for _ in range(200):
+        translators = random_translators(random, packages, requirement_count)
+        formula = random_requirements_formula(random, requirement_count)
+
+        expected_formula = [
+            translated_clause
+            for clause in formula
+            for translated_clause in translate_clause(translators, clause, None)
+        ]
+
+        encoding = Encoding(formula_config)
+
+        encoded_formula = [
+            translated_clause
+            for clause in formula
+            for translated_clause in translate_clause(translators, clause, encoding)
+        ]
+
+        for values in range(1 << len(packages)):
+            assignment = {
+                package: bool(values & (1 << index))
+                for index, package in enumerate(packages)
+            }
+
+            assert is_symbolic_satisfiable(
+                encoded_formula, assignment
+            ) == is_symbolic_satisfied(expected_formula, assignment)
+
+
+def test_auxiliary_negations():
+    check_encoding(FormulaConfig(negation_encoding="auxiliary"), 0)
+
+
+def test_shared_disjunctions():
+    check_encoding(FormulaConfig(share_disjunctions=True), 1)
+
+
+def test_shared_disjunctions_with_auxiliary_negations():
+    check_encoding(
+        FormulaConfig(negation_encoding="auxiliary", share_disjunctions=True), 2
+    )
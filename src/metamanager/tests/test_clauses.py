@@ -0,0 +1,14 @@
+from PPpackage.metamanager.clauses import Clauses
+
+
+def test_clauses():
+    formula = [[1, -2], [], [3, 4, -5]]
+
+    clauses = Clauses(formula)
+    clauses.append(iter([6]))
+
+    assert len(clauses) == 4
+    assert list(clauses) == [*formula, [6]]
+    assert clauses[-1] == [6]
+    assert clauses[1:3] == formula[1:3]
+    assert list(Clauses.from_bytes(*clauses.to_bytes())) == list(clauses)
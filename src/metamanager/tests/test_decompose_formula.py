@@ -0,0 +1,82 @@
+from asyncio import run
+from random import Random
+
+import pytest
+from formulas import enumerate_positives, is_satisfied, random_formula
+
+from PPpackage.metamanager.clauses import Clauses
+from PPpackage.metamanager.decompose_formula import decompose_formula
+from PPpackage.metamanager.exceptions import NoModelException
+from PPpackage.metamanager.resolve import PrunedResolveSession
+from PPpackage.metamanager.solver.local import LocalSolver
+
+
+def test_decompose_formula():
+    random = Random(0)
+
+    for _ in range(300):
+        formula = random_formula(random, random.randint(1, 8), 6, min_clause_count=0)
+
+        components, variable_to_component = decompose_formula(formula)
+
+        assert sorted(clause for component in components for clause in component) == (
+            sorted(formula)
+        )
+
+        for index, component in enumerate(components):
+            for clause in component:
+                for literal in clause:
+                    assert variable_to_component[abs(literal)] == index
+
+
+async def solve_decomposed(formula, variable_count, requirements):
+    solver = LocalSolver("glucose4")
+
+    try:
+        session = PrunedResolveSession(
+            {},
+            [f"package-{variable}" for variable in range(1, variable_count + 1)],
+            Clauses(formula),
+            solver,
+            None,
+            True,
+        )
+
+        return await session.solve_decomposed(Clauses(formula), requirements, [])
+    finally:
+        solver.close()
+
+
+def test_conflicting_free_requirements():
+    with pytest.raises(NoModelException):
+        run(solve_decomposed([[-1, 2]], 3, [3, -3]))
+
+
+def test_exhaustive():
+    random = Random(0)
+
+    for _ in range(200):
+        variable_count = random.randint(1, 6)
+        formula = random_formula(random, variable_count, 6, min_clause_count=0)
+        requirements = [
+            random.choice([-1, 1]) * random.randint(1, variable_count)
+            for _ in range(random.randint(0, 3))
+        ]
+
+        is_satisfiable = any(
+            is_satisfied(
+                [*formula, *([requirement] for requirement in requirements)],
+                positives,
+            )
+            for positives in enumerate_positives(variable_count)
+        )
+
+        try:
+            model = run(solve_decomposed(formula, variable_count, requirements))
+        except NoModelException:
+            assert not is_satisfiable
+        else:
+            assert is_satisfiable
+            assert is_satisfied(
+                [*formula, *([requirement] for requirement in requirements)], model
+            )
@@ -0,0 +1,48 @@
+from itertools import product
+from random import Random
+
+from formulas import is_satisfied, random_formula
+
+from PPpackage.metamanager.build_formula import AUXILIARY_PREFIX
+from PPpackage.metamanager.lock import is_model_valid
+
+
+def test_exhaustive():
+    random = Random(0)
+
+    package_count = 3
+    auxiliary_count = 2
+    symbols = [
+        *(f"package-{i}" for i in range(package_count)),
+        *(f"{AUXILIARY_PREFIX}{i}" for i in range(auxiliary_count)),
+    ]
+    mapping_to_int = {symbol: index + 1 for index, symbol in enumerate(symbols)}
+    packages = list(range(1, package_count + 1))
+    auxiliaries = list(range(package_count + 1, len(symbols) + 1))
+
+    for _ in range(300):
+        formula = random_formula(random, len(symbols), 6)
+
+        for values in product([False, True], repeat=package_count):
+            model_variables = {
+                variable for variable, value in zip(packages, values) if value
+            }
+
+            is_valid = any(
+                is_satisfied(
+                    formula,
+                    model_variables
+                    | {
+                        variable
+                        for variable, value in zip(auxiliaries, auxiliary_values)
+                        if value
+                    },
+                )
+                for auxiliary_values in product([False, True], repeat=auxiliary_count)
+            )
+
+            model = {symbols[variable - 1] for variable in model_variables}
+
+            assert (
+                is_model_valid(model, formula, mapping_to_int, symbols, []) == is_valid
+            )
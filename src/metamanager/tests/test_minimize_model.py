@@ -0,0 +1,96 @@
+from asyncio import run
+from random import Random
+
+from formulas import enumerate_positives, is_satisfied, random_formula
+
+from PPpackage.metamanager.clauses import Clauses
+from PPpackage.metamanager.exceptions import NoModelException
+from PPpackage.metamanager.minimize_model import minimize_model
+from PPpackage.metamanager.solver.local import LocalSolver
+
+
+async def minimize(formula, variable_count, requirements):
+    mapping_to_string: list[str | None] = [
+        f"package-{variable}" for variable in range(1, variable_count + 1)
+    ]
+
+    def create_activation_variable():
+        mapping_to_string.append(None)
+        return len(mapping_to_string)
+
+    solver = LocalSolver("glucose4")
+
+    try:
+        session = await solver.create_session(Clauses(formula))
+        model = await session.solve(variable_count, requirements, [])
+
+        return await minimize_model(
+            session,
+            create_activation_variable,
+            mapping_to_string,
+            range(1, variable_count + 1),
+            requirements,
+            model,
+            60.0,
+        )
+    finally:
+        solver.close()
+
+
+def test_exhaustive():
+    random = Random(0)
+
+    for _ in range(100):
+        variable_count = random.randint(1, 6)
+        formula = random_formula(random, variable_count, 8)
+        requirements = [random.randint(1, variable_count)]
+
+        try:
+            model = run(minimize(formula, variable_count, requirements))
+        except NoModelException:
+            continue
+
+        assert model.issuperset(requirements)
+        assert is_satisfied(formula, model)
+
+        # no model selects a strict subset of the packages
+        for positives in enumerate_positives(variable_count):
+            if positives < model and positives.issuperset(requirements):
+                assert not is_satisfied(formula, positives)
+
+
+async def count_added_clauses(package_count):
+    mapping_to_string: list[str | None] = [
+        f"package-{variable}" for variable in range(1, package_count + 1)
+    ]
+
+    def create_activation_variable():
+        mapping_to_string.append(None)
+        return len(mapping_to_string)
+
+    # package 1 needs package 2 or package 3, the other packages are unrelated
+    formula = Clauses([[-1, 2, 3]])
+
+    solver = LocalSolver("glucose4")
+
+    try:
+        session = await solver.create_session(formula)
+        model = await session.solve(package_count, [1], [])
+
+        await minimize_model(
+            session,
+            create_activation_variable,
+            mapping_to_string,
+            range(1, package_count + 1),
+            [1],
+            model | {2, 3},
+            60.0,
+        )
+
+        return len(session.added_clauses)
+    finally:
+        solver.close()
+
+
+def test_session_does_not_grow_with_packages():
+    assert run(count_added_clauses(10)) == run(count_added_clauses(1000))
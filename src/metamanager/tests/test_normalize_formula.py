@@ -0,0 +1,49 @@
+from random import Random
+
+from formulas import enumerate_positives, is_satisfied, random_formula
+
+from PPpackage.metamanager.normalize_formula import normalize_formula
+
+
+def test_statistics():
+    formula = [[1, 2], [2, 1], [1, -1], [1], [1, 3], [2, 2]]
+
+    normalized_formula, statistics = normalize_formula(formula)
+
+    assert sorted(normalized_formula) == [[1], [2]]
+    assert statistics.duplicates == 1
+    assert statistics.tautologies == 1
+    assert statistics.subsumed == 2
+
+
+def test_exhaustive():
+    random = Random(0)
+
+    for _ in range(300):
+        variable_count = random.randint(1, 6)
+        formula = random_formula(random, variable_count, 8, 4)
+
+        normalized_formula, statistics = normalize_formula(formula)
+
+        normalized_clauses = [set(clause) for clause in normalized_formula]
+
+        # no clause is repeated, tautological or subsumed by another one
+        for index, clause in enumerate(normalized_clauses):
+            assert len(clause) == len(normalized_formula[index])
+            assert not any(-literal in clause for literal in clause)
+            assert not any(
+                other_clause <= clause
+                for other_index, other_clause in enumerate(normalized_clauses)
+                if other_index != index
+            )
+
+        assert len(
+            normalized_formula
+        ) + statistics.duplicates + statistics.tautologies + statistics.subsumed == len(
+            formula
+        )
+
+        for positives in enumerate_positives(variable_count):
+            assert is_satisfied(normalized_formula, positives) == is_satisfied(
+                formula, positives
+            )
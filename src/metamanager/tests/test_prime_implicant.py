@@ -0,0 +1,34 @@
+from itertools import product
+from random import Random
+
+from formulas import is_satisfied, random_formula
+
+from PPpackage.metamanager.solver.local import get_prime_implicant
+
+
+def enumerate_models(formula, variable_count):
+    for values in product([False, True], repeat=variable_count):
+        model = [
+            variable if value else -variable for variable, value in enumerate(values, 1)
+        ]
+
+        if is_satisfied(formula, {literal for literal in model if literal > 0}):
+            yield model
+
+
+def test_repeated_literal():
+    assert get_prime_implicant([[1, 1], [2]], [1, 2]) == {1, 2}
+
+
+def test_exhaustive():
+    random = Random(0)
+
+    for _ in range(300):
+        variable_count = random.randint(1, 5)
+        formula = random_formula(random, variable_count, 6, 4)
+
+        for model in enumerate_models(formula, variable_count):
+            implicant = get_prime_implicant(formula, model)
+
+            assert implicant <= {literal for literal in model if literal > 0}
+            assert is_satisfied(formula, implicant)
@@ -0,0 +1,37 @@
+from random import Random
+
+from formulas import enumerate_positives, is_satisfied, random_formula
+
+from PPpackage.metamanager.prune_formula import index_formula, prune_formula
+
+
+def test_exhaustive():
+    random = Random(0)
+
+    for _ in range(300):
+        variable_count = random.randint(1, 6)
+        formula = random_formula(random, variable_count, 8)
+        roots = random.sample(
+            range(1, variable_count + 1), random.randint(0, variable_count)
+        )
+
+        negative_occurrences, positive_clauses = index_formula(formula)
+        pruned_formula = prune_formula(
+            formula, negative_occurrences, positive_clauses, roots
+        )
+
+        assert all(clause in formula for clause in pruned_formula)
+
+        pruned_variables = {
+            abs(literal) for clause in pruned_formula for literal in clause
+        }
+
+        for positives in enumerate_positives(variable_count):
+            if not positives.issuperset(roots):
+                continue
+
+            # the variables outside of the pruned formula are set to false
+            if is_satisfied(pruned_formula, positives):
+                assert is_satisfied(
+                    formula, (positives & pruned_variables).union(roots)
+                )
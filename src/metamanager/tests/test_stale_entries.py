@@ -0,0 +1,37 @@
+from sqlitedict import SqliteDict
+
+from PPpackage.metamanager.stale_entries import evict_stale_entries
+
+
+class Repository:
+    def __init__(self, name: str, epoch: str):
+        self.name = name
+        self.epoch = epoch
+
+
+def save(cache_path, cache_key, repositories):
+    with SqliteDict(cache_path) as cache:
+        cache[cache_key] = cache_key
+        cache.commit()
+
+    evict_stale_entries(cache_path, cache_key, repositories)
+
+
+def test_evict_stale_entries(tmp_path):
+    cache_path = tmp_path / "cache"
+
+    with SqliteDict(cache_path) as cache:
+        cache["untracked"] = None
+        cache.commit()
+
+    save(cache_path, "arch-1", [Repository("arch", "1")])
+    save(
+        cache_path,
+        "arch-1-conan-1",
+        [Repository("arch", "1"), Repository("conan", "1")],
+    )
+    save(cache_path, "aur-1", [Repository("aur", "1")])
+    save(cache_path, "arch-2", [Repository("arch", "2")])
+
+    with SqliteDict(cache_path, flag="r") as cache:
+        assert set(cache.keys()) == {"aur-1", "arch-2"}
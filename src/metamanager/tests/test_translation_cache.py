@@ -0,0 +1,145 @@
+from asyncio import run
+
+from pydantic import BaseModel
+
+import PPpackage.metamanager.translators
+from PPpackage.metamanager.parallel_translation import receive_batch
+from PPpackage.metamanager.schemes import TranslatorConfig
+from PPpackage.metamanager.translation_cache import (
+    evict_translations,
+    get_requirement_key,
+    hash_translation_cache_key,
+    load_assumptions,
+    load_translations,
+    save_assumptions,
+    save_translations,
+)
+from PPpackage.metamanager.translator_data import TranslatorData
+from PPpackage.metamanager.translators import (
+    Translators,
+    save_translators_translations,
+)
+from PPpackage.translator.interface.interface import Interface
+from PPpackage.translator.interface.schemes import Literal
+
+
+class Repository:
+    def __init__(self, name: str, epoch: str):
+        self.name = name
+        self.epoch = epoch
+
+    async def fetch_translator_data(self):
+        return TranslatorData()
+
+
+def save(cache_path, config, repositories):
+    cache_key = hash_translation_cache_key(config, repositories)
+
+    evict_translations(cache_path, [cache_key])
+    save_translations(cache_path, cache_key, {"bash": [f"bash-{cache_key}"]})
+    save_assumptions(cache_path, cache_key, [Literal(cache_key, False)])
+
+    return cache_key
+
+
+def is_cached(cache_path, cache_key):
+    return (
+        load_translations(cache_path, cache_key) == {"bash": [f"bash-{cache_key}"]}
+        and load_assumptions(cache_path, cache_key) is not None
+    )
+
+
+def test_evict_older_epochs_of_same_setup(tmp_path):
+    cache_path = tmp_path / "translation"
+
+    pacman = TranslatorConfig(package="PPpackage.translator.pacman")
+    conan = TranslatorConfig(package="PPpackage.translator.conan")
+
+    pacman_old = save(cache_path, pacman, [Repository("arch", "1")])
+    conan_old = save(cache_path, conan, [Repository("arch", "1")])
+    pacman_other = save(cache_path, pacman, [Repository("aur", "1")])
+    pacman_new = save(cache_path, pacman, [Repository("arch", "2")])
+
+    assert not is_cached(cache_path, pacman_old)
+    assert is_cached(cache_path, conan_old)
+    assert is_cached(cache_path, pacman_other)
+    assert is_cached(cache_path, pacman_new)
+
+
+def test_requirement_keys_do_not_collide():
+    requirement = {"package": "bash", "version": ">=5"}
+
+    assert get_requirement_key(requirement) == get_requirement_key(
+        {"version": ">=5", "package": "bash"}
+    )
+    assert get_requirement_key(requirement) != get_requirement_key(
+        get_requirement_key(requirement)
+    )
+    assert get_requirement_key("1") != get_requirement_key(1)
+
+
+class Parameters(BaseModel):
+    pass
+
+
+translated_requirements = list[str]()
+
+
+def translate_requirement(parameters, data, requirement):
+    translated_requirements.append(requirement)
+    return [f"package-{requirement}"]
+
+
+interface = Interface(
+    Parameters=Parameters,
+    Requirement=str,
+    get_assumptions=lambda parameters, data: [],
+    get_exclusive_groups=lambda parameters, data: [],
+    translate_requirement=translate_requirement,
+)
+
+
+async def translate(cache_path, repositories, requirements, worker_translations):
+    translators_config = {"test": TranslatorConfig(package="test")}
+
+    translators, _ = await Translators(repositories, translators_config, cache_path)
+
+    translations = translators["test"].translate_requirements(requirements)
+
+    # as if the translations were computed by a translation worker
+    receive_batch(translators, (([], []), {"test": worker_translations}))
+
+    save_translators_translations(
+        cache_path, repositories, translators_config, translators
+    )
+
+    return translations
+
+
+def test_translations_are_persisted(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        PPpackage.metamanager.translators,
+        "load_interface_module",
+        lambda Interface, package: interface,
+    )
+
+    cache_path = tmp_path / "translation"
+    repositories = [Repository("arch", "1")]
+
+    translated_requirements.clear()
+
+    assert run(
+        translate(
+            cache_path, repositories, ["bash", "zsh"], {'"fish"': ["package-fish"]}
+        )
+    ) == [["package-bash"], ["package-zsh"]]
+    assert translated_requirements == ["bash", "zsh"]
+
+    assert run(translate(cache_path, repositories, ["bash", "fish"], {})) == [
+        ["package-bash"],
+        ["package-fish"],
+    ]
+    assert translated_requirements == ["bash", "zsh"]
+
+    run(translate(cache_path, [Repository("arch", "2")], ["bash"], {}))
+    assert translated_requirements == ["bash", "zsh", "bash"]
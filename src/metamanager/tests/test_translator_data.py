@@ -0,0 +1,174 @@
+from pickle import dumps as pickle_dumps
+from pickle import loads as pickle_loads
+from random import Random
+
+from PPpackage.metamanager.translator_data import (
+    MergedTranslatorData,
+    TranslatorData,
+    TranslatorGroup,
+    load_translator_data,
+    save_translator_data,
+)
+from PPpackage.metamanager.translators import Assumptions
+from PPpackage.translator.interface.schemes import Literal
+
+KEYS = ["version", "provider", "revision"]
+
+
+def random_data(random, group_count):
+    groups = dict[str, list[dict[str, str]]]()
+
+    for _ in range(random.randint(0, 12)):
+        groups.setdefault(f"group-{random.randrange(group_count)}", []).append(
+            {
+                key: f"{key}-{random.randrange(3)}"
+                for key in random.sample(KEYS, random.randint(0, len(KEYS)))
+            }
+        )
+
+    return groups
+
+
+def create_translator_data(groups):
+    data = TranslatorData()
+
+    for group, symbols in groups.items():
+        for symbol in symbols:
+            data.add(group, symbol)
+
+    return data
+
+
+def as_plain(data):
+    return {
+        group: [dict(symbol) for symbol in symbols] for group, symbols in data.items()
+    }
+
+
+def test_columns():
+    random = Random(0)
+
+    for _ in range(300):
+        groups = random_data(random, 3)
+
+        data = create_translator_data(groups)
+
+        assert as_plain(data) == groups
+        assert as_plain(pickle_loads(pickle_dumps(data))) == groups
+
+        for group, symbols in groups.items():
+            assert [dict(symbol) for symbol in data[group][::-1]] == symbols[::-1]
+
+            for symbol, expected_symbol in zip(data[group], symbols):
+                assert len(symbol) == len(expected_symbol)
+                assert all(symbol.get(key) == expected_symbol.get(key) for key in KEYS)
+
+
+def test_extend():
+    random = Random(1)
+
+    for _ in range(300):
+        first = random_data(random, 1).get("group-0", [])
+        second = random_data(random, 1).get("group-0", [])
+
+        group = TranslatorGroup()
+
+        for symbol in first:
+            group.append(symbol)
+
+        other_group = TranslatorGroup()
+
+        for symbol in second:
+            other_group.append(symbol)
+
+        group.extend(other_group)
+
+        assert [dict(symbol) for symbol in group] == first + second
+
+
+def test_cache(tmp_path):
+    random = Random(2)
+
+    cache_path = tmp_path / "translator-data"
+
+    for epoch in range(20):
+        groups = random_data(random, 4)
+
+        save_translator_data(cache_path, str(epoch), create_translator_data(groups))
+
+        data = load_translator_data(cache_path, str(epoch))
+
+        assert data is not None
+        assert data.cache is None
+        assert set(data) == groups.keys()
+
+        # the groups are loaded lazily, one at a time
+        for group, symbols in groups.items():
+            assert [dict(symbol) for symbol in data[group]] == symbols
+
+        assert as_plain(pickle_loads(pickle_dumps(data))) == groups
+
+        data.close()
+
+        assert as_plain(data) == groups
+
+        data.close()
+
+        # only the latest epoch is kept
+        assert load_translator_data(cache_path, str(epoch - 1)) is None
+
+
+def test_merged():
+    random = Random(3)
+
+    for _ in range(300):
+        sources = [random_data(random, 3) for _ in range(random.randint(1, 3))]
+
+        expected_groups = dict[str, list[dict[str, str]]]()
+
+        for source in sources:
+            for group, symbols in source.items():
+                expected_groups.setdefault(group, []).extend(symbols)
+
+        data = MergedTranslatorData(
+            [create_translator_data(source) for source in sources]
+        )
+
+        group = random.choice([*expected_groups, "missing"])
+
+        assert (group in data) == (group in expected_groups)
+
+        if group in expected_groups:
+            assert [dict(symbol) for symbol in data[group]] == expected_groups[group]
+
+        assert as_plain(data) == expected_groups
+
+
+class Translator:
+    def __init__(self, assumptions):
+        self.assumptions = assumptions
+        self.count = 0
+
+    def get_assumptions(self):
+        self.count += 1
+        return self.assumptions
+
+
+def test_cached_assumptions(tmp_path):
+    cache_path = tmp_path / "translation"
+
+    translator = Translator([Literal("package-1", False)])
+    other_translator = Translator([Literal("package-2", False)])
+
+    for _ in range(2):
+        assumptions = Assumptions(
+            [translator, other_translator], cache_path, ["key", "other-key"]
+        )
+
+        assert set(assumptions) == {
+            Literal("package-1", False),
+            Literal("package-2", False),
+        }
+
+    assert translator.count == 1
+    assert other_translator.count == 1
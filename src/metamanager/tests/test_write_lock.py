@@ -0,0 +1,44 @@
+from dataclasses import replace
+from json import loads as json_loads
+
+from PPpackage.repository_driver.interface.schemes import Requirement
+from PPpackage.utils.json.validate import validate_json
+
+from PPpackage.metamanager.lock import create_lock
+from PPpackage.metamanager.main import write_lock
+from PPpackage.metamanager.schemes import Input
+
+
+class Repository:
+    def __init__(self, name: str, epoch: str):
+        self.name = name
+        self.epoch = epoch
+
+
+def test_write_lock(tmp_path):
+    input = Input(
+        requirements=[Requirement("pacman", "bash")],
+        options={"architecture": "x86_64"},
+        generators=frozenset({"versions", "conan"}),
+    )
+
+    locked_input = replace(
+        input,
+        locks=create_lock(
+            [Repository("arch", "1"), Repository("conan", "2")],
+            {"pacman-bash-5.2", "pacman-glibc-2.39", "pacman-readline-8.2"},
+        ),
+    )
+
+    lock_path = tmp_path / "lock.json"
+
+    write_lock(lock_path, locked_input)
+
+    lock_json = lock_path.read_text()
+
+    assert json_loads(lock_json)["locks"]["model"] == [
+        "pacman-bash-5.2",
+        "pacman-glibc-2.39",
+        "pacman-readline-8.2",
+    ]
+    assert validate_json(Input, lock_json) == locked_input
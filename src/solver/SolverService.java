@@ -0,0 +1,185 @@
+package solver;
+
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.EOFException;
+import java.io.InputStream;
+import java.io.OutputStream;
+import java.net.StandardProtocolFamily;
+import java.net.UnixDomainSocketAddress;
+import java.nio.channels.Channels;
+import java.nio.channels.ServerSocketChannel;
+import java.nio.channels.SocketChannel;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.ArrayList;
+import java.util.List;
+
+import org.sat4j.core.VecInt;
+import org.sat4j.minisat.SolverFactory;
+import org.sat4j.reader.DimacsReader;
+import org.sat4j.specs.ContradictionException;
+import org.sat4j.specs.IProblem;
+
+
+public class SolverService {
+    static String read_line(InputStream input) throws Exception
+    {
+        var line = new ByteArrayOutputStream();
+        int character;
+
+        while ((character = input.read()) != '\n') {
+            if (character == -1) {
+                if (line.size() == 0) {
+                    return null;
+                }
+
+                throw new EOFException();
+            }
+
+            line.write(character);
+        }
+
+        return line.toString(StandardCharsets.UTF_8).strip();
+    }
+
+    static boolean read_bool(InputStream input) throws Exception
+    {
+        var line = read_line(input);
+
+        if (line == null) {
+            throw new EOFException();
+        }
+
+        return line.equals("T");
+    }
+
+    static byte[] read_bytes(InputStream input) throws Exception
+    {
+        var line = read_line(input);
+
+        if (line == null) {
+            throw new EOFException();
+        }
+
+        int length = Integer.valueOf(line);
+        byte[] bytes = input.readNBytes(length);
+
+        if (bytes.length != length) {
+            throw new EOFException();
+        }
+
+        return bytes;
+    }
+
+    static void write_bool(OutputStream output, boolean value) throws Exception
+    {
+        output.write((value ? "T\n" : "F\n").getBytes(StandardCharsets.UTF_8));
+    }
+
+    static void write_one(OutputStream output, String json) throws Exception
+    {
+        byte[] bytes = json.getBytes(StandardCharsets.UTF_8);
+
+        output.write((bytes.length + "\n").getBytes(StandardCharsets.UTF_8));
+        output.write(bytes);
+    }
+
+    static boolean handle_request(InputStream input, OutputStream output) throws Exception
+    {
+        var first_line = read_line(input);
+
+        if (first_line == null) {
+            return false;
+        }
+
+        var formula = new ByteArrayOutputStream();
+        boolean has_chunk = first_line.equals("T");
+
+        while (has_chunk) {
+            formula.write(read_bytes(input));
+            has_chunk = read_bool(input);
+        }
+
+        List<Integer> all_assumptions = new ArrayList<Integer>();
+
+        while (read_bool(input)) {
+            var literal = new String(read_bytes(input), StandardCharsets.UTF_8);
+            all_assumptions.add(Integer.valueOf(literal.strip()));
+        }
+
+        var solver = SolverFactory.newDefault();
+        var reader = new DimacsReader(solver);
+        IProblem problem;
+
+        try {
+            problem = reader.parseInstance(new ByteArrayInputStream(formula.toByteArray()));
+        } catch (ContradictionException e) {
+            write_one(output, "false");
+            output.flush();
+            return true;
+        }
+
+        if (!problem.isSatisfiable()) {
+            write_one(output, "false");
+            output.flush();
+            return true;
+        }
+
+        var assumptions = new VecInt();
+
+        if (all_assumptions.size() > 0) {
+            Solver.try_assumptions(problem, assumptions, all_assumptions, 0, all_assumptions.size());
+        }
+
+        problem.isSatisfiable(assumptions);
+
+        write_one(output, "true");
+
+        for (int variable : solver.primeImplicant()) {
+            if (variable > 0) {
+                write_bool(output, true);
+                write_one(output, String.valueOf(variable));
+            }
+        }
+
+        write_bool(output, false);
+        output.flush();
+
+        return true;
+    }
+
+    static void handle_connection(SocketChannel channel) throws Exception
+    {
+        var input = new BufferedInputStream(Channels.newInputStream(channel));
+        var output = new BufferedOutputStream(Channels.newOutputStream(channel));
+
+        while (handle_request(input, output)) {
+        }
+    }
+
+    public static void main(String[] args) {
+        try {
+            var socket_path = Path.of(args[0]);
+
+            Files.deleteIfExists(socket_path);
+
+            var server = ServerSocketChannel.open(StandardProtocolFamily.UNIX);
+            server.bind(UnixDomainSocketAddress.of(socket_path));
+
+            while (true) {
+                try (var channel = server.accept()) {
+                    handle_connection(channel);
+                } catch (Exception e) {
+                    System.err.println("Error: " + e.getMessage());
+                }
+            }
+        } catch (Exception e) {
+            System.err.println("Error: " + e.getMessage());
+            System.exit(2);
+        }
+    }
+}
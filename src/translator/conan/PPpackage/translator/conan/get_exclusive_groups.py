@@ -0,0 +1,23 @@
+from collections.abc import Iterable
+
+from PPpackage.translator.interface.schemes import Data
+
+from .schemes import Parameters
+
+
+def get_exclusive_groups(parameters: Parameters, data: Data) -> Iterable[Iterable[str]]:
+    for group, symbols in data.items():
+        if not group.startswith("conan-"):
+            continue
+
+        name = group[len("conan-") :]
+
+        revisions = list(
+            dict.fromkeys(
+                f"conan-{name}/{symbol['version']}#{symbol['revision']}"
+                for symbol in symbols
+            )
+        )
+
+        if len(revisions) > 1:
+            yield revisions
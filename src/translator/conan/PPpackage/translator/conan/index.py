@@ -0,0 +1,67 @@
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import cache
+
+from conans.model.version import Version
+from conans.model.version_range import VersionRange
+
+from PPpackage.translator.interface.data_cache import DataCache
+from PPpackage.translator.interface.schemes import Data
+
+
+@dataclass(frozen=True)
+class VersionEntry:
+    version: Version
+    literals: Sequence[str]
+
+
+@dataclass(frozen=True)
+class GroupIndex:
+    # one entry per distinct version, sorted by conan version ordering
+    versions: Sequence[VersionEntry]
+    version_to_literals: Mapping[str, Sequence[str]]
+
+
+def create_group_index(name: str, symbols: Iterable[Mapping[str, str]]) -> GroupIndex:
+    version_to_literals = dict[str, list[str]]()
+
+    for symbol in symbols:
+        version_to_literals.setdefault(symbol["version"], []).append(
+            f"conan-{name}/{symbol['version']}#{symbol['revision']}"
+        )
+
+    versions = sorted(
+        (
+            VersionEntry(Version(version), literals)
+            for version, literals in version_to_literals.items()
+        ),
+        key=lambda entry: entry.version,
+    )
+
+    return GroupIndex(versions, version_to_literals)
+
+
+EMPTY_GROUP_INDEX = GroupIndex([], {})
+
+group_indices_cache = DataCache[GroupIndex]()
+
+
+def get_group_index(data: Data, name: str) -> GroupIndex:
+    group_indices = group_indices_cache.get(data)
+    group_index = group_indices.get(name)
+
+    if group_index is None:
+        symbols = data.get(f"conan-{name}")
+
+        if symbols is None:
+            return EMPTY_GROUP_INDEX
+
+        group_index = create_group_index(name, symbols)
+        group_indices[name] = group_index
+
+    return group_index
+
+
+@cache
+def parse_version_range(expression: str) -> VersionRange:
+    return VersionRange(expression)
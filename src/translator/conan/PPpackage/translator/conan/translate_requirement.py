@@ -1,8 +1,6 @@
 from collections.abc import Iterable, Mapping
 
-from conans.model.version import Version
-from conans.model.version_range import VersionRange
-
+from .index import get_group_index, parse_version_range
 from .schemes import Parameters, Requirement
 
 
@@ -11,19 +9,18 @@ def translate_requirement(
     data: Mapping[str, Iterable[dict[str, str]]],
     requirement: Requirement,
 ) -> Iterable[str]:
-    symbols = data.get(f"conan-{requirement.package}", [])
-
     if requirement.version.startswith("[") and requirement.version.endswith("]"):
-        version_range = VersionRange(requirement.version[1:-1])
+        group_index = get_group_index(data, requirement.package)
+        version_range = parse_version_range(requirement.version[1:-1])
 
-        for symbol in symbols:
-            if version_range.contains(Version(symbol["version"]), False):
-                yield f"conan-{requirement.package}/{symbol['version']}#{symbol['revision']}"
+        for entry in group_index.versions:
+            if version_range.contains(entry.version, False):
+                yield from entry.literals
 
     elif requirement.version.find("#") == -1:
-        for symbol in symbols:
-            if symbol["version"] == requirement.version:
-                yield f"conan-{requirement.package}/{symbol['version']}#{symbol['revision']}"
+        group_index = get_group_index(data, requirement.package)
+
+        yield from group_index.version_to_literals.get(requirement.version, [])
 
     else:
         yield f"conan-{requirement.package}/{requirement.version}"
@@ -0,0 +1,35 @@
+from weakref import ref
+
+from .schemes import Data
+
+
+class DataCache[ValueType]:
+    def __init__(self):
+        # the data is usually not hashable, so the entries are keyed by its id and an
+        # entry is removed when its data is collected
+        self.entries = dict[int, tuple[ref[Data], dict[str, ValueType]]]()
+
+    def remove(self, key: int, data_ref: ref[Data]) -> None:
+        entry = self.entries.get(key)
+
+        # the id may already be reused by newer data
+        if entry is not None and entry[0] is data_ref:
+            del self.entries[key]
+
+    def get(self, data: Data) -> dict[str, ValueType]:
+        key = id(data)
+        entry = self.entries.get(key)
+
+        if entry is not None and entry[0]() is data:
+            return entry[1]
+
+        try:
+            data_ref = ref(data, lambda data_ref: self.remove(key, data_ref))
+        except TypeError:
+            # the values for data that cannot be referenced weakly are not kept
+            return {}
+
+        values = dict[str, ValueType]()
+        self.entries[key] = data_ref, values
+
+        return values
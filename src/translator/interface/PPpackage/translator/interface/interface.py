@@ -11,6 +11,7 @@ class Interface[ParametersType: BaseModel, RequirementType]:
     Parameters: type[ParametersType]
     Requirement: type[RequirementType]
     get_assumptions: Callable[[ParametersType, Data], Iterable[Literal]]
+    get_exclusive_groups: Callable[[ParametersType, Data], Iterable[Iterable[str]]]
     translate_requirement: Callable[
         [ParametersType, Data, RequirementType],
         Iterable[str],
@@ -1,7 +1,7 @@
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 
-type Data = Mapping[str, Iterable[dict[str, str]]]
+type Data = Mapping[str, Iterable[Mapping[str, str]]]
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,40 @@
+from gc import collect
+
+from PPpackage.translator.interface.data_cache import DataCache
+
+
+class Data(dict):
+    pass
+
+
+def test_values_are_kept_per_data():
+    cache = DataCache[int]()
+
+    data = Data()
+    other_data = Data()
+
+    cache.get(data)["group"] = 1
+
+    assert cache.get(data) == {"group": 1}
+    assert cache.get(other_data) == {}
+
+
+def test_entry_is_removed_with_its_data():
+    cache = DataCache[int]()
+
+    data = Data()
+    cache.get(data)["group"] = 1
+
+    del data
+    collect()
+
+    assert len(cache.entries) == 0
+
+
+def test_data_without_weak_references_is_not_kept():
+    cache = DataCache[int]()
+
+    data = {}
+    cache.get(data)["group"] = 1
+
+    assert cache.get(data) == {}
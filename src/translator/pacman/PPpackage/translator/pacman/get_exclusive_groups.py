@@ -0,0 +1,24 @@
+from collections.abc import Iterable
+
+from PPpackage.translator.interface.schemes import Data
+
+from .schemes import Parameters
+
+
+def get_exclusive_groups(parameters: Parameters, data: Data) -> Iterable[Iterable[str]]:
+    for group, symbols in data.items():
+        if not group.startswith("pacman-"):
+            continue
+
+        name = group[len("pacman-") :]
+
+        packages = list(
+            dict.fromkeys(
+                f"pacman-{name}-{symbol['version']}"
+                for symbol in symbols
+                if "provider" not in symbol
+            )
+        )
+
+        if len(packages) > 1:
+            yield packages
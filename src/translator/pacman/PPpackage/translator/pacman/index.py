@@ -0,0 +1,96 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import cmp_to_key
+from operator import eq, ge, gt, le, lt
+from typing import Any
+
+from pyalpm import vercmp as alpm_vercmp
+
+from PPpackage.translator.interface.data_cache import DataCache
+from PPpackage.translator.interface.schemes import Data
+
+from .utils import process_symbol
+
+version_key = cmp_to_key(alpm_vercmp)
+
+
+@dataclass(frozen=True)
+class GroupIndex:
+    # package suffixes in the order of the group's symbols
+    packages: Sequence[str]
+    # sorted alpm version keys, versioned_packages is parallel to them
+    versions: Sequence[Any]
+    versioned_packages: Sequence[str]
+    no_provide: str | None
+
+
+def create_group_index(name: str, symbols: Iterable[Mapping[str, str]]) -> GroupIndex:
+    packages = list[str]()
+    versioned = list[tuple[Any, str]]()
+    no_provide = None
+
+    for symbol in symbols:
+        package_suffix, version = process_symbol(name, symbol)
+
+        packages.append(package_suffix)
+
+        if version is not None:
+            versioned.append((version_key(version), package_suffix))
+
+        if no_provide is None and "provider" not in symbol:
+            no_provide = f"{name}-{symbol['version']}"
+
+    versioned.sort(key=lambda entry: entry[0])
+
+    return GroupIndex(
+        packages,
+        [version for version, _ in versioned],
+        [package_suffix for _, package_suffix in versioned],
+        no_provide,
+    )
+
+
+EMPTY_GROUP_INDEX = GroupIndex([], [], [], None)
+
+group_indices_cache = DataCache[GroupIndex]()
+
+
+def get_group_index(data: Data, name: str) -> GroupIndex:
+    group_indices = group_indices_cache.get(data)
+    group_index = group_indices.get(name)
+
+    if group_index is None:
+        symbols = data.get(f"pacman-{name}")
+
+        if symbols is None:
+            return EMPTY_GROUP_INDEX
+
+        group_index = create_group_index(name, symbols)
+        group_indices[name] = group_index
+
+    return group_index
+
+
+def select_versions(
+    group_index: GroupIndex,
+    comparison: Callable[[int, int], bool],
+    version: str,
+) -> Sequence[str]:
+    versions = group_index.versions
+    key = version_key(version)
+
+    if comparison is eq:
+        begin, end = bisect_left(versions, key), bisect_right(versions, key)
+    elif comparison is ge:
+        begin, end = bisect_left(versions, key), len(versions)
+    elif comparison is gt:
+        begin, end = bisect_right(versions, key), len(versions)
+    elif comparison is le:
+        begin, end = 0, bisect_right(versions, key)
+    elif comparison is lt:
+        begin, end = 0, bisect_left(versions, key)
+    else:
+        raise ValueError(f"Unsupported comparison {comparison}.")
+
+    return group_index.versioned_packages[begin:end]
@@ -1,6 +1,7 @@
 from PPpackage.translator.interface.interface import Interface
 
 from .get_assumptions import get_assumptions
+from .get_exclusive_groups import get_exclusive_groups
 from .schemes import ExcludeRequirement, NoProvideRequirement, Parameters
 from .translate_requirement import translate_requirement
 
@@ -8,5 +9,6 @@ interface = Interface(
     Parameters=Parameters,
     Requirement=str | ExcludeRequirement | NoProvideRequirement,  # type: ignore
     get_assumptions=get_assumptions,
+    get_exclusive_groups=get_exclusive_groups,
     translate_requirement=translate_requirement,
 )
@@ -1,12 +1,10 @@
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable
 from operator import eq, ge, gt, le, lt
 
-from pyalpm import vercmp as alpm_vercmp
-
 from PPpackage.translator.interface.schemes import Data
 
+from .index import get_group_index, select_versions
 from .schemes import ExcludeRequirement, NoProvideRequirement, Parameters
-from .utils import process_symbol
 
 
 def parse_requirement(
@@ -26,47 +24,29 @@ def parse_requirement(
     return requirement, None
 
 
-def version_compare(
-    version_left: str | None,
-    comparison: Callable[[int, int], bool],
-    version_right: str,
-) -> bool:
-    if version_left is None:
-        return False
-
-    cmp = alpm_vercmp(version_left, version_right)
-
-    return comparison(cmp, 0)
-
-
 def create_atoms(
+    data: Data,
     name: str,
-    symbols: Iterable[Mapping[str, str]],
     version_expression: tuple[Callable[[int, int], bool], str] | None,
     exclude: str | None,
 ) -> Iterable[str]:
-    for symbol in symbols:
-        package_suffix, version = process_symbol(name, symbol)
+    group_index = get_group_index(data, name)
 
-        if package_suffix == exclude:
-            continue
+    package_suffixes = (
+        group_index.packages
+        if version_expression is None
+        else select_versions(group_index, *version_expression)
+    )
 
-        if version_expression is None or version_compare(
-            version,
-            version_expression[0],
-            version_expression[1],
-        ):
+    for package_suffix in package_suffixes:
+        if package_suffix != exclude:
             yield f"pacman-{package_suffix}"
 
 
 def handle_no_provide(data: Data, requirement: NoProvideRequirement) -> str | None:
-    symbols = data.get(f"pacman-{requirement.package}", [])
+    no_provide = get_group_index(data, requirement.package).no_provide
 
-    for symbol in symbols:
-        if "provider" not in symbol:
-            return f"pacman-{requirement.package}-{symbol['version']}"
-
-    return None
+    return f"pacman-{no_provide}" if no_provide is not None else None
 
 
 def translate_requirement(
@@ -92,7 +72,5 @@ def translate_requirement(
 
     name, version_expression = parse_requirement(requirement_name)
 
-    symbols = data.get(f"pacman-{name}", [])
-
-    for literal in create_atoms(name, symbols, version_expression, exclude):
+    for literal in create_atoms(data, name, version_expression, exclude):
         yield literal
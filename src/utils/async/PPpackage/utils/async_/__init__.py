@@ -1,4 +1,6 @@
-from collections.abc import AsyncIterable, Callable
+from asyncio import Queue, create_task, gather
+from collections.abc import AsyncGenerator, AsyncIterable, Callable, Iterable
+from typing import Any
 
 from asyncstdlib.itertools import chain as async_chain
 
@@ -30,3 +32,47 @@ async def get_async_iterable_result[
         return result.get(), async_chain()
     else:
         return result.get(), async_chain([first], i)
+
+
+class _Failure:
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+
+_END = object()
+
+
+async def _feed_queue(queue: Queue[Any], iterable: AsyncIterable[Any]) -> None:
+    try:
+        async for item in iterable:
+            await queue.put(item)
+    except Exception as exception:
+        await queue.put(_Failure(exception))
+    else:
+        await queue.put(_END)
+
+
+async def merge_async_iterables[
+    T
+](iterables: Iterable[AsyncIterable[T]], max_size: int) -> AsyncGenerator[T, None]:
+    queue = Queue[Any](max_size)
+
+    tasks = [create_task(_feed_queue(queue, iterable)) for iterable in iterables]
+
+    try:
+        remaining_count = len(tasks)
+
+        while remaining_count != 0:
+            item = await queue.get()
+
+            if item is _END:
+                remaining_count -= 1
+            elif isinstance(item, _Failure):
+                raise item.exception
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        await gather(*tasks, return_exceptions=True)
@@ -58,6 +58,33 @@ class Containerizer:
 
             return return_code
 
+    def start(
+        self,
+        command: list[str],
+        image: str | None = None,
+        mounts: list[Any] | None = None,
+        **kwargs,
+    ) -> str:
+        with PodmanClient(base_url=str(self.config.url)) as client:
+            container = client.containers.create(
+                image if image is not None else "",
+                command,
+                **kwargs,
+                mounts=mounts if mounts is not None else [],
+                security_opt=["disable"],
+            )
+
+            container.start()
+
+            return type_cast(str, container.id)
+
+    def stop(self, container_id: str) -> None:
+        with PodmanClient(base_url=str(self.config.url)) as client:
+            container = client.containers.get(container_id)
+
+            container.stop()
+            container.remove()
+
     def pull_if_missing(self, tag: str):
         with PodmanClient(base_url=str(self.config.url)) as client:
             exists = client.images.exists(tag)
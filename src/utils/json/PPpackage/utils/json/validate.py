@@ -1,38 +1,36 @@
+from functools import cache
 from inspect import isclass
 from pathlib import Path
 from typing import IO, Any
 
-from pydantic import BaseModel, RootModel
+from pydantic import BaseModel, TypeAdapter
 
 
-def _unwrap_instance(output: Any) -> Any:
-    return output.root if isinstance(output, RootModel) else output
+@cache
+def _get_cached_adapter(Model: Any) -> TypeAdapter:
+    return TypeAdapter(Model)
 
 
-def _wrap_model[T](Model: type[T]) -> type[BaseModel]:
-    return (
-        Model if isclass(Model) and issubclass(Model, BaseModel) else RootModel[Model]
-    )
+def _get_adapter[T](Model: type[T]) -> TypeAdapter[T]:
+    try:
+        return _get_cached_adapter(Model)
+    except TypeError:
+        # unhashable type expressions cannot be cached
+        return TypeAdapter(Model)
 
 
 def validate_python[T](Model: type[T], input_python: Any) -> T:
-    ModelWrapped = _wrap_model(Model)
+    if isclass(Model) and issubclass(Model, BaseModel):
+        return Model.model_validate(input_python)
 
-    input_wrapped = ModelWrapped.model_validate(input_python)
-
-    input = _unwrap_instance(input_wrapped)
-
-    return input
+    return _get_adapter(Model).validate_python(input_python)
 
 
 def validate_json[T](Model: type[T], input_json: str | bytes) -> T:
-    ModelWrapped = _wrap_model(Model)
+    if isclass(Model) and issubclass(Model, BaseModel):
+        return Model.model_validate_json(input_json)
 
-    input_wrapped = ModelWrapped.model_validate_json(input_json)
-
-    input = _unwrap_instance(input_wrapped)
-
-    return input
+    return _get_adapter(Model).validate_json(input_json)
 
 
 def validate_json_io[T](Model: type[T], input_io: IO[bytes]) -> T:
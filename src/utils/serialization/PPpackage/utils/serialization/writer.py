@@ -34,6 +34,26 @@ async def dump_loop(
     yield _dump_bool(False)
 
 
+async def dump_bytes(output: memoryview) -> AsyncIterable[memoryview]:
+    yield _dump_int(len(output))
+    yield output
+
+
+async def dump_bytes_chunked(
+    chunks: AsyncIterable[memoryview],
+) -> AsyncIterable[memoryview]:
+    async for chunk in chunks:
+        if len(chunk) == 0:
+            continue
+
+        yield _dump_bool(True)
+
+        async for dumped_chunk in dump_bytes(chunk):
+            yield dumped_chunk
+
+    yield _dump_bool(False)
+
+
 async def dump_one(output: BaseModel | Any) -> AsyncIterable[memoryview]:
     output_wrapped = wrap_instance(output)
 